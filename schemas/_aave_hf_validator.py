@@ -0,0 +1,578 @@
+# Generated by scripts/gen_validator.py from aave-base-hf-snapshot.schema.json; do not edit.
+SCHEMA_FINGERPRINT = "597130bdc2d71ed15958cb019b82ff3a"
+VERSION = "2.22.2"
+from decimal import Decimal
+import re
+from fastjsonschema import JsonSchemaValueException, JsonSchemaValuesException
+
+
+REGEX_PATTERNS = {
+    '^(?:0|[1-9]\\d*)$': re.compile('^(?:0|[1-9]\\d*)\\Z'),
+    '^[0-9]+$': re.compile('^[0-9]+\\Z'),
+    '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$': re.compile('^(?:0|[1-9]\\d*)(?:\\.\\d+)?\\Z'),
+    '^-?(?:0|[1-9]\\d*)(?:\\.\\d+)?$': re.compile('^-?(?:0|[1-9]\\d*)(?:\\.\\d+)?\\Z'),
+    '^0x[0-9a-fA-F]{40}$': re.compile('^0x[0-9a-fA-F]{40}\\Z')
+}
+
+NoneType = type(None)
+
+def validate_https___example_com_schemas_aave_hf_snapshot_schema_json(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'$schema': 'http://json-schema.org/draft-07/schema#', '$id': 'https://example.com/schemas/aave-hf-snapshot.schema.json', 'title': 'AAVE v3 Health Factor Snapshot (Base)', 'type': 'object', 'additionalProperties': False, 'required': ['network', 'chain_id', 'address', 'timestamp', 'user', 'totals', 'collateral', 'debt', 'oracles', 'config', 'meta'], 'properties': {'network': {'const': 'base'}, 'chain_id': {'type': 'integer', 'const': 8453}, 'address': {'type': 'string', 'pattern': '^0x[0-9a-fA-F]{40}$'}, 'timestamp': {'type': 'integer', 'minimum': 0}, 'user': {'type': 'object', 'additionalProperties': False, 'required': ['health_factor', 'ltv', 'liquidation_threshold', 'liquidation_buffer_usd', 'available_borrows_usd', 'risk_class', 'is_safe', 'stress_tests'], 'properties': {'health_factor': {'type': 'string', 'pattern': '^-?(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'ltv': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'liquidation_threshold': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'liquidation_buffer_usd': {'type': 'string', 'pattern': '^-?(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'available_borrows_usd': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'risk_class': {'type': 'string', 'enum': ['low', 'moderate', 'high']}, 'is_safe': {'type': 'boolean'}, 'stress_tests': {'type': 'object', 'additionalProperties': False, 'required': ['hf_minus_1pct', 'hf_minus_3pct', 'hf_minus_5pct'], 'properties': {'hf_minus_1pct': {'type': 'string', 'pattern': '^-?(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'hf_minus_3pct': {'type': 'string', 'pattern': '^-?(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'hf_minus_5pct': {'type': 'string', 'pattern': '^-?(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}}}}}, 'totals': {'type': 'object', 'additionalProperties': False, 'required': ['total_collateral_usd', 'total_debt_usd', 'net_equity_usd', 'current_leverage_ratio', 'max_leverage_at_current_hf'], 'properties': {'total_collateral_usd': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'total_debt_usd': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'net_equity_usd': {'type': 'string', 'pattern': '^-?(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'current_leverage_ratio': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'max_leverage_at_current_hf': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}}}, 'collateral': {'type': 'array', 'items': {'type': 'object', 'additionalProperties': False, 'required': ['token', 'amount', 'amount_usd', 'price_usd', 'usage_as_collateral_enabled', 'reserve_ltv', 'reserve_liquidation_threshold', 'reserve_liquidation_bonus', 'emode_category'], 'properties': {'token': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/token'}, 'amount': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}, 'amount_usd': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}, 'price_usd': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}, 'usage_as_collateral_enabled': {'type': 'boolean'}, 'reserve_ltv': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}, 'reserve_liquidation_threshold': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}, 'reserve_liquidation_bonus': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}, 'emode_category': {'type': ['string', 'null'], 'pattern': '^[0-9]+$'}}}}, 'debt': {'type': 'array', 'items': {'type': 'object', 'additionalProperties': False, 'required': ['token', 'variable_debt', 'stable_debt', 'total_debt_usd', 'variable_borrow_apy', 'stable_borrow_apy', 'reserve_utilization', 'borrow_cap', 'borrow_cap_used_percent'], 'properties': {'token': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/token'}, 'variable_debt': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}, 'stable_debt': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}, 'total_debt_usd': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}, 'variable_borrow_apy': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}, 'stable_borrow_apy': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}, 'reserve_utilization': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}, 'borrow_cap': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)$'}, 'borrow_cap_used_percent': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}}}}, 'oracles': {'type': 'object', 'additionalProperties': False, 'required': ['base_currency', 'assets'], 'properties': {'base_currency': {'type': 'object', 'additionalProperties': False, 'required': ['symbol', 'price_usd', 'last_update'], 'properties': {'symbol': {'type': 'string'}, 'price_usd': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'last_update': {'type': 'integer', 'minimum': 0}}}, 'assets': {'type': 'array', 'items': {'type': 'object', 'additionalProperties': False, 'required': ['token', 'price_usd', 'last_update', 'confidence_score'], 'properties': {'token': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/token'}, 'price_usd': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}, 'last_update': {'type': 'integer', 'minimum': 0}, 'confidence_score': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}}}}}}, 'config': {'type': 'object', 'additionalProperties': False, 'required': ['emode', 'isolation_mode', 'caps'], 'properties': {'emode': {'type': 'object', 'additionalProperties': False, 'required': ['active', 'category', 'settings'], 'properties': {'active': {'type': 'boolean'}, 'category': {'type': ['string', 'null']}, 'settings': {'type': ['object', 'null']}}}, 'isolation_mode': {'type': 'object', 'additionalProperties': False, 'required': ['active', 'debt_ceiling_remaining_usd'], 'properties': {'active': {'type': 'boolean'}, 'debt_ceiling_remaining_usd': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}}}, 'caps': {'type': 'array', 'items': {'type': 'object', 'additionalProperties': False, 'required': ['token', 'supply_cap', 'supply_cap_used_percent', 'borrow_cap', 'borrow_cap_used_percent'], 'properties': {'token': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/token'}, 'supply_cap': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)$'}, 'supply_cap_used_percent': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}, 'borrow_cap': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)$'}, 'borrow_cap_used_percent': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}}}}}}, 'meta': {'type': 'object', 'additionalProperties': False, 'required': ['data_provider', 'oracle_source', 'latency_ms', 'version'], 'properties': {'data_provider': {'type': 'string'}, 'oracle_source': {'type': 'string'}, 'latency_ms': {'type': 'integer', 'minimum': 0}, 'version': {'type': 'string'}}}}, '$defs': {'address': {'type': 'string', 'pattern': '^0x[0-9a-fA-F]{40}$'}, 'decimalString': {'type': 'string', 'pattern': '^-?(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'udecimalString': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'token': {'type': 'object', 'additionalProperties': False, 'required': ['symbol', 'address', 'decimals'], 'properties': {'symbol': {'type': 'string'}, 'address': {'type': 'string', 'pattern': '^0x[0-9a-fA-F]{40}$'}, 'decimals': {'type': 'integer', 'minimum': 0, 'maximum': 255}}}, 'collateralItem': {'type': 'object', 'additionalProperties': False, 'required': ['token', 'amount', 'amount_usd', 'price_usd', 'usage_as_collateral_enabled', 'reserve_ltv', 'reserve_liquidation_threshold', 'reserve_liquidation_bonus', 'emode_category'], 'properties': {'token': {'type': 'object', 'additionalProperties': False, 'required': ['symbol', 'address', 'decimals'], 'properties': {'symbol': {'type': 'string'}, 'address': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/address'}, 'decimals': {'type': 'integer', 'minimum': 0, 'maximum': 255}}}, 'amount': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'amount_usd': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'price_usd': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'usage_as_collateral_enabled': {'type': 'boolean'}, 'reserve_ltv': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'reserve_liquidation_threshold': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'reserve_liquidation_bonus': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'emode_category': {'type': ['string', 'null'], 'pattern': '^[0-9]+$'}}}, 'debtItem': {'type': 'object', 'additionalProperties': False, 'required': ['token', 'variable_debt', 'stable_debt', 'total_debt_usd', 'variable_borrow_apy', 'stable_borrow_apy', 'reserve_utilization', 'borrow_cap', 'borrow_cap_used_percent'], 'properties': {'token': {'type': 'object', 'additionalProperties': False, 'required': ['symbol', 'address', 'decimals'], 'properties': {'symbol': {'type': 'string'}, 'address': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/address'}, 'decimals': {'type': 'integer', 'minimum': 0, 'maximum': 255}}}, 'variable_debt': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'stable_debt': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'total_debt_usd': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'variable_borrow_apy': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'stable_borrow_apy': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'reserve_utilization': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'borrow_cap': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)$'}, 'borrow_cap_used_percent': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}}}, 'oracleAsset': {'type': 'object', 'additionalProperties': False, 'required': ['token', 'price_usd', 'last_update', 'confidence_score'], 'properties': {'token': {'type': 'object', 'additionalProperties': False, 'required': ['symbol', 'address', 'decimals'], 'properties': {'symbol': {'type': 'string'}, 'address': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/address'}, 'decimals': {'type': 'integer', 'minimum': 0, 'maximum': 255}}}, 'price_usd': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'last_update': {'type': 'integer', 'minimum': 0}, 'confidence_score': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}}}, 'capItem': {'type': 'object', 'additionalProperties': False, 'required': ['token', 'supply_cap', 'supply_cap_used_percent', 'borrow_cap', 'borrow_cap_used_percent'], 'properties': {'token': {'type': 'object', 'additionalProperties': False, 'required': ['symbol', 'address', 'decimals'], 'properties': {'symbol': {'type': 'string'}, 'address': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/address'}, 'decimals': {'type': 'integer', 'minimum': 0, 'maximum': 255}}}, 'supply_cap': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)$'}, 'supply_cap_used_percent': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'borrow_cap': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)$'}, 'borrow_cap_used_percent': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}}}}, 'examples': [{'network': 'base', 'chain_id': 8453, 'address': '0x0000000000000000000000000000000000000000', 'timestamp': 1700000000, 'user': {'health_factor': '1.23', 'ltv': '0.72', 'liquidation_threshold': '0.78', 'liquidation_buffer_usd': '123.45', 'available_borrows_usd': '456.78', 'risk_class': 'moderate', 'is_safe': True, 'stress_tests': {'hf_minus_1pct': '1.21', 'hf_minus_3pct': '1.18', 'hf_minus_5pct': '1.17'}}, 'totals': {'total_collateral_usd': '1000.00', 'total_debt_usd': '600.00', 'net_equity_usd': '400.00', 'current_leverage_ratio': '2.50', 'max_leverage_at_current_hf': '4.00'}, 'collateral': [], 'debt': [], 'oracles': {'base_currency': {'symbol': 'ETH', 'price_usd': '2000.00', 'last_update': 1700000000}, 'assets': []}, 'config': {'emode': {'active': False, 'category': None, 'settings': None}, 'isolation_mode': {'active': False, 'debt_ceiling_remaining_usd': '0'}, 'caps': []}, 'meta': {'data_provider': 'aave-v3', 'oracle_source': 'aave-oracle', 'latency_ms': 10, 'version': '1.0.0'}}]}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['network', 'chain_id', 'address', 'timestamp', 'user', 'totals', 'collateral', 'debt', 'oracles', 'config', 'meta']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'$schema': 'http://json-schema.org/draft-07/schema#', '$id': 'https://example.com/schemas/aave-hf-snapshot.schema.json', 'title': 'AAVE v3 Health Factor Snapshot (Base)', 'type': 'object', 'additionalProperties': False, 'required': ['network', 'chain_id', 'address', 'timestamp', 'user', 'totals', 'collateral', 'debt', 'oracles', 'config', 'meta'], 'properties': {'network': {'const': 'base'}, 'chain_id': {'type': 'integer', 'const': 8453}, 'address': {'type': 'string', 'pattern': '^0x[0-9a-fA-F]{40}$'}, 'timestamp': {'type': 'integer', 'minimum': 0}, 'user': {'type': 'object', 'additionalProperties': False, 'required': ['health_factor', 'ltv', 'liquidation_threshold', 'liquidation_buffer_usd', 'available_borrows_usd', 'risk_class', 'is_safe', 'stress_tests'], 'properties': {'health_factor': {'type': 'string', 'pattern': '^-?(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'ltv': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'liquidation_threshold': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'liquidation_buffer_usd': {'type': 'string', 'pattern': '^-?(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'available_borrows_usd': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'risk_class': {'type': 'string', 'enum': ['low', 'moderate', 'high']}, 'is_safe': {'type': 'boolean'}, 'stress_tests': {'type': 'object', 'additionalProperties': False, 'required': ['hf_minus_1pct', 'hf_minus_3pct', 'hf_minus_5pct'], 'properties': {'hf_minus_1pct': {'type': 'string', 'pattern': '^-?(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'hf_minus_3pct': {'type': 'string', 'pattern': '^-?(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'hf_minus_5pct': {'type': 'string', 'pattern': '^-?(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}}}}}, 'totals': {'type': 'object', 'additionalProperties': False, 'required': ['total_collateral_usd', 'total_debt_usd', 'net_equity_usd', 'current_leverage_ratio', 'max_leverage_at_current_hf'], 'properties': {'total_collateral_usd': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'total_debt_usd': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'net_equity_usd': {'type': 'string', 'pattern': '^-?(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'current_leverage_ratio': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'max_leverage_at_current_hf': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}}}, 'collateral': {'type': 'array', 'items': {'type': 'object', 'additionalProperties': False, 'required': ['token', 'amount', 'amount_usd', 'price_usd', 'usage_as_collateral_enabled', 'reserve_ltv', 'reserve_liquidation_threshold', 'reserve_liquidation_bonus', 'emode_category'], 'properties': {'token': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/token'}, 'amount': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}, 'amount_usd': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}, 'price_usd': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}, 'usage_as_collateral_enabled': {'type': 'boolean'}, 'reserve_ltv': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}, 'reserve_liquidation_threshold': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}, 'reserve_liquidation_bonus': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}, 'emode_category': {'type': ['string', 'null'], 'pattern': '^[0-9]+$'}}}}, 'debt': {'type': 'array', 'items': {'type': 'object', 'additionalProperties': False, 'required': ['token', 'variable_debt', 'stable_debt', 'total_debt_usd', 'variable_borrow_apy', 'stable_borrow_apy', 'reserve_utilization', 'borrow_cap', 'borrow_cap_used_percent'], 'properties': {'token': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/token'}, 'variable_debt': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}, 'stable_debt': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}, 'total_debt_usd': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}, 'variable_borrow_apy': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}, 'stable_borrow_apy': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}, 'reserve_utilization': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}, 'borrow_cap': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)$'}, 'borrow_cap_used_percent': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}}}}, 'oracles': {'type': 'object', 'additionalProperties': False, 'required': ['base_currency', 'assets'], 'properties': {'base_currency': {'type': 'object', 'additionalProperties': False, 'required': ['symbol', 'price_usd', 'last_update'], 'properties': {'symbol': {'type': 'string'}, 'price_usd': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'last_update': {'type': 'integer', 'minimum': 0}}}, 'assets': {'type': 'array', 'items': {'type': 'object', 'additionalProperties': False, 'required': ['token', 'price_usd', 'last_update', 'confidence_score'], 'properties': {'token': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/token'}, 'price_usd': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}, 'last_update': {'type': 'integer', 'minimum': 0}, 'confidence_score': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}}}}}}, 'config': {'type': 'object', 'additionalProperties': False, 'required': ['emode', 'isolation_mode', 'caps'], 'properties': {'emode': {'type': 'object', 'additionalProperties': False, 'required': ['active', 'category', 'settings'], 'properties': {'active': {'type': 'boolean'}, 'category': {'type': ['string', 'null']}, 'settings': {'type': ['object', 'null']}}}, 'isolation_mode': {'type': 'object', 'additionalProperties': False, 'required': ['active', 'debt_ceiling_remaining_usd'], 'properties': {'active': {'type': 'boolean'}, 'debt_ceiling_remaining_usd': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}}}, 'caps': {'type': 'array', 'items': {'type': 'object', 'additionalProperties': False, 'required': ['token', 'supply_cap', 'supply_cap_used_percent', 'borrow_cap', 'borrow_cap_used_percent'], 'properties': {'token': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/token'}, 'supply_cap': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)$'}, 'supply_cap_used_percent': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}, 'borrow_cap': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)$'}, 'borrow_cap_used_percent': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}}}}}}, 'meta': {'type': 'object', 'additionalProperties': False, 'required': ['data_provider', 'oracle_source', 'latency_ms', 'version'], 'properties': {'data_provider': {'type': 'string'}, 'oracle_source': {'type': 'string'}, 'latency_ms': {'type': 'integer', 'minimum': 0}, 'version': {'type': 'string'}}}}, '$defs': {'address': {'type': 'string', 'pattern': '^0x[0-9a-fA-F]{40}$'}, 'decimalString': {'type': 'string', 'pattern': '^-?(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'udecimalString': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'token': {'type': 'object', 'additionalProperties': False, 'required': ['symbol', 'address', 'decimals'], 'properties': {'symbol': {'type': 'string'}, 'address': {'type': 'string', 'pattern': '^0x[0-9a-fA-F]{40}$'}, 'decimals': {'type': 'integer', 'minimum': 0, 'maximum': 255}}}, 'collateralItem': {'type': 'object', 'additionalProperties': False, 'required': ['token', 'amount', 'amount_usd', 'price_usd', 'usage_as_collateral_enabled', 'reserve_ltv', 'reserve_liquidation_threshold', 'reserve_liquidation_bonus', 'emode_category'], 'properties': {'token': {'type': 'object', 'additionalProperties': False, 'required': ['symbol', 'address', 'decimals'], 'properties': {'symbol': {'type': 'string'}, 'address': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/address'}, 'decimals': {'type': 'integer', 'minimum': 0, 'maximum': 255}}}, 'amount': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'amount_usd': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'price_usd': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'usage_as_collateral_enabled': {'type': 'boolean'}, 'reserve_ltv': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'reserve_liquidation_threshold': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'reserve_liquidation_bonus': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'emode_category': {'type': ['string', 'null'], 'pattern': '^[0-9]+$'}}}, 'debtItem': {'type': 'object', 'additionalProperties': False, 'required': ['token', 'variable_debt', 'stable_debt', 'total_debt_usd', 'variable_borrow_apy', 'stable_borrow_apy', 'reserve_utilization', 'borrow_cap', 'borrow_cap_used_percent'], 'properties': {'token': {'type': 'object', 'additionalProperties': False, 'required': ['symbol', 'address', 'decimals'], 'properties': {'symbol': {'type': 'string'}, 'address': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/address'}, 'decimals': {'type': 'integer', 'minimum': 0, 'maximum': 255}}}, 'variable_debt': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'stable_debt': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'total_debt_usd': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'variable_borrow_apy': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'stable_borrow_apy': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'reserve_utilization': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'borrow_cap': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)$'}, 'borrow_cap_used_percent': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}}}, 'oracleAsset': {'type': 'object', 'additionalProperties': False, 'required': ['token', 'price_usd', 'last_update', 'confidence_score'], 'properties': {'token': {'type': 'object', 'additionalProperties': False, 'required': ['symbol', 'address', 'decimals'], 'properties': {'symbol': {'type': 'string'}, 'address': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/address'}, 'decimals': {'type': 'integer', 'minimum': 0, 'maximum': 255}}}, 'price_usd': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'last_update': {'type': 'integer', 'minimum': 0}, 'confidence_score': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}}}, 'capItem': {'type': 'object', 'additionalProperties': False, 'required': ['token', 'supply_cap', 'supply_cap_used_percent', 'borrow_cap', 'borrow_cap_used_percent'], 'properties': {'token': {'type': 'object', 'additionalProperties': False, 'required': ['symbol', 'address', 'decimals'], 'properties': {'symbol': {'type': 'string'}, 'address': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/address'}, 'decimals': {'type': 'integer', 'minimum': 0, 'maximum': 255}}}, 'supply_cap': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)$'}, 'supply_cap_used_percent': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'borrow_cap': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)$'}, 'borrow_cap_used_percent': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}}}}, 'examples': [{'network': 'base', 'chain_id': 8453, 'address': '0x0000000000000000000000000000000000000000', 'timestamp': 1700000000, 'user': {'health_factor': '1.23', 'ltv': '0.72', 'liquidation_threshold': '0.78', 'liquidation_buffer_usd': '123.45', 'available_borrows_usd': '456.78', 'risk_class': 'moderate', 'is_safe': True, 'stress_tests': {'hf_minus_1pct': '1.21', 'hf_minus_3pct': '1.18', 'hf_minus_5pct': '1.17'}}, 'totals': {'total_collateral_usd': '1000.00', 'total_debt_usd': '600.00', 'net_equity_usd': '400.00', 'current_leverage_ratio': '2.50', 'max_leverage_at_current_hf': '4.00'}, 'collateral': [], 'debt': [], 'oracles': {'base_currency': {'symbol': 'ETH', 'price_usd': '2000.00', 'last_update': 1700000000}, 'assets': []}, 'config': {'emode': {'active': False, 'category': None, 'settings': None}, 'isolation_mode': {'active': False, 'debt_ceiling_remaining_usd': '0'}, 'caps': []}, 'meta': {'data_provider': 'aave-v3', 'oracle_source': 'aave-oracle', 'latency_ms': 10, 'version': '1.0.0'}}]}, rule='required')
+        data_keys = set(data.keys())
+        if "network" in data_keys:
+            data_keys.remove("network")
+            data__network = data["network"]
+            if not (isinstance(data__network, str) and data__network == 'base'):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".network must be same as const definition: base", value=data__network, name="" + (name_prefix or "data") + ".network", definition={'const': 'base'}, rule='const')
+        if "chain_id" in data_keys:
+            data_keys.remove("chain_id")
+            data__chainid = data["chain_id"]
+            if not isinstance(data__chainid, (int)) and not (isinstance(data__chainid, float) and data__chainid.is_integer()) or isinstance(data__chainid, bool):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".chain_id must be integer", value=data__chainid, name="" + (name_prefix or "data") + ".chain_id", definition={'type': 'integer', 'const': 8453}, rule='type')
+            if not (isinstance(data__chainid, (int, float)) and not isinstance(data__chainid, bool) and data__chainid == 8453):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".chain_id must be same as const definition: 8453", value=data__chainid, name="" + (name_prefix or "data") + ".chain_id", definition={'type': 'integer', 'const': 8453}, rule='const')
+        if "address" in data_keys:
+            data_keys.remove("address")
+            data__address = data["address"]
+            validate_https___example_com_schemas_aave_hf_snapshot_schema_json___defs_address(data__address, custom_formats, (name_prefix or "data") + ".address")
+        if "timestamp" in data_keys:
+            data_keys.remove("timestamp")
+            data__timestamp = data["timestamp"]
+            if not isinstance(data__timestamp, (int)) and not (isinstance(data__timestamp, float) and data__timestamp.is_integer()) or isinstance(data__timestamp, bool):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".timestamp must be integer", value=data__timestamp, name="" + (name_prefix or "data") + ".timestamp", definition={'type': 'integer', 'minimum': 0}, rule='type')
+            if isinstance(data__timestamp, (int, float, Decimal)):
+                if data__timestamp < 0:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".timestamp must be bigger than or equal to 0", value=data__timestamp, name="" + (name_prefix or "data") + ".timestamp", definition={'type': 'integer', 'minimum': 0}, rule='minimum')
+        if "user" in data_keys:
+            data_keys.remove("user")
+            data__user = data["user"]
+            if not isinstance(data__user, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".user must be object", value=data__user, name="" + (name_prefix or "data") + ".user", definition={'type': 'object', 'additionalProperties': False, 'required': ['health_factor', 'ltv', 'liquidation_threshold', 'liquidation_buffer_usd', 'available_borrows_usd', 'risk_class', 'is_safe', 'stress_tests'], 'properties': {'health_factor': {'type': 'string', 'pattern': '^-?(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'ltv': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'liquidation_threshold': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'liquidation_buffer_usd': {'type': 'string', 'pattern': '^-?(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'available_borrows_usd': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'risk_class': {'type': 'string', 'enum': ['low', 'moderate', 'high']}, 'is_safe': {'type': 'boolean'}, 'stress_tests': {'type': 'object', 'additionalProperties': False, 'required': ['hf_minus_1pct', 'hf_minus_3pct', 'hf_minus_5pct'], 'properties': {'hf_minus_1pct': {'type': 'string', 'pattern': '^-?(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'hf_minus_3pct': {'type': 'string', 'pattern': '^-?(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'hf_minus_5pct': {'type': 'string', 'pattern': '^-?(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}}}}}, rule='type')
+            data__user_is_dict = isinstance(data__user, dict)
+            if data__user_is_dict:
+                data__user__missing_keys = set(['health_factor', 'ltv', 'liquidation_threshold', 'liquidation_buffer_usd', 'available_borrows_usd', 'risk_class', 'is_safe', 'stress_tests']) - data__user.keys()
+                if data__user__missing_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".user must contain " + (str(sorted(data__user__missing_keys)) + " properties"), value=data__user, name="" + (name_prefix or "data") + ".user", definition={'type': 'object', 'additionalProperties': False, 'required': ['health_factor', 'ltv', 'liquidation_threshold', 'liquidation_buffer_usd', 'available_borrows_usd', 'risk_class', 'is_safe', 'stress_tests'], 'properties': {'health_factor': {'type': 'string', 'pattern': '^-?(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'ltv': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'liquidation_threshold': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'liquidation_buffer_usd': {'type': 'string', 'pattern': '^-?(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'available_borrows_usd': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'risk_class': {'type': 'string', 'enum': ['low', 'moderate', 'high']}, 'is_safe': {'type': 'boolean'}, 'stress_tests': {'type': 'object', 'additionalProperties': False, 'required': ['hf_minus_1pct', 'hf_minus_3pct', 'hf_minus_5pct'], 'properties': {'hf_minus_1pct': {'type': 'string', 'pattern': '^-?(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'hf_minus_3pct': {'type': 'string', 'pattern': '^-?(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'hf_minus_5pct': {'type': 'string', 'pattern': '^-?(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}}}}}, rule='required')
+                data__user_keys = set(data__user.keys())
+                if "health_factor" in data__user_keys:
+                    data__user_keys.remove("health_factor")
+                    data__user__healthfactor = data__user["health_factor"]
+                    validate_https___example_com_schemas_aave_hf_snapshot_schema_json___defs_decimalstring(data__user__healthfactor, custom_formats, (name_prefix or "data") + ".user.health_factor")
+                if "ltv" in data__user_keys:
+                    data__user_keys.remove("ltv")
+                    data__user__ltv = data__user["ltv"]
+                    validate_https___example_com_schemas_aave_hf_snapshot_schema_json___defs_udecimalstring(data__user__ltv, custom_formats, (name_prefix or "data") + ".user.ltv")
+                if "liquidation_threshold" in data__user_keys:
+                    data__user_keys.remove("liquidation_threshold")
+                    data__user__liquidationthreshold = data__user["liquidation_threshold"]
+                    validate_https___example_com_schemas_aave_hf_snapshot_schema_json___defs_udecimalstring(data__user__liquidationthreshold, custom_formats, (name_prefix or "data") + ".user.liquidation_threshold")
+                if "liquidation_buffer_usd" in data__user_keys:
+                    data__user_keys.remove("liquidation_buffer_usd")
+                    data__user__liquidationbufferusd = data__user["liquidation_buffer_usd"]
+                    validate_https___example_com_schemas_aave_hf_snapshot_schema_json___defs_decimalstring(data__user__liquidationbufferusd, custom_formats, (name_prefix or "data") + ".user.liquidation_buffer_usd")
+                if "available_borrows_usd" in data__user_keys:
+                    data__user_keys.remove("available_borrows_usd")
+                    data__user__availableborrowsusd = data__user["available_borrows_usd"]
+                    validate_https___example_com_schemas_aave_hf_snapshot_schema_json___defs_udecimalstring(data__user__availableborrowsusd, custom_formats, (name_prefix or "data") + ".user.available_borrows_usd")
+                if "risk_class" in data__user_keys:
+                    data__user_keys.remove("risk_class")
+                    data__user__riskclass = data__user["risk_class"]
+                    if not isinstance(data__user__riskclass, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".user.risk_class must be string", value=data__user__riskclass, name="" + (name_prefix or "data") + ".user.risk_class", definition={'type': 'string', 'enum': ['low', 'moderate', 'high']}, rule='type')
+                    if not (isinstance(data__user__riskclass, str) and data__user__riskclass == 'low' or isinstance(data__user__riskclass, str) and data__user__riskclass == 'moderate' or isinstance(data__user__riskclass, str) and data__user__riskclass == 'high'):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".user.risk_class must be one of ['low', 'moderate', 'high']", value=data__user__riskclass, name="" + (name_prefix or "data") + ".user.risk_class", definition={'type': 'string', 'enum': ['low', 'moderate', 'high']}, rule='enum')
+                if "is_safe" in data__user_keys:
+                    data__user_keys.remove("is_safe")
+                    data__user__issafe = data__user["is_safe"]
+                    if not isinstance(data__user__issafe, (bool)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".user.is_safe must be boolean", value=data__user__issafe, name="" + (name_prefix or "data") + ".user.is_safe", definition={'type': 'boolean'}, rule='type')
+                if "stress_tests" in data__user_keys:
+                    data__user_keys.remove("stress_tests")
+                    data__user__stresstests = data__user["stress_tests"]
+                    if not isinstance(data__user__stresstests, (dict)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".user.stress_tests must be object", value=data__user__stresstests, name="" + (name_prefix or "data") + ".user.stress_tests", definition={'type': 'object', 'additionalProperties': False, 'required': ['hf_minus_1pct', 'hf_minus_3pct', 'hf_minus_5pct'], 'properties': {'hf_minus_1pct': {'type': 'string', 'pattern': '^-?(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'hf_minus_3pct': {'type': 'string', 'pattern': '^-?(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'hf_minus_5pct': {'type': 'string', 'pattern': '^-?(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}}}, rule='type')
+                    data__user__stresstests_is_dict = isinstance(data__user__stresstests, dict)
+                    if data__user__stresstests_is_dict:
+                        data__user__stresstests__missing_keys = set(['hf_minus_1pct', 'hf_minus_3pct', 'hf_minus_5pct']) - data__user__stresstests.keys()
+                        if data__user__stresstests__missing_keys:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".user.stress_tests must contain " + (str(sorted(data__user__stresstests__missing_keys)) + " properties"), value=data__user__stresstests, name="" + (name_prefix or "data") + ".user.stress_tests", definition={'type': 'object', 'additionalProperties': False, 'required': ['hf_minus_1pct', 'hf_minus_3pct', 'hf_minus_5pct'], 'properties': {'hf_minus_1pct': {'type': 'string', 'pattern': '^-?(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'hf_minus_3pct': {'type': 'string', 'pattern': '^-?(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'hf_minus_5pct': {'type': 'string', 'pattern': '^-?(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}}}, rule='required')
+                        data__user__stresstests_keys = set(data__user__stresstests.keys())
+                        if "hf_minus_1pct" in data__user__stresstests_keys:
+                            data__user__stresstests_keys.remove("hf_minus_1pct")
+                            data__user__stresstests__hfminus1pct = data__user__stresstests["hf_minus_1pct"]
+                            validate_https___example_com_schemas_aave_hf_snapshot_schema_json___defs_decimalstring(data__user__stresstests__hfminus1pct, custom_formats, (name_prefix or "data") + ".user.stress_tests.hf_minus_1pct")
+                        if "hf_minus_3pct" in data__user__stresstests_keys:
+                            data__user__stresstests_keys.remove("hf_minus_3pct")
+                            data__user__stresstests__hfminus3pct = data__user__stresstests["hf_minus_3pct"]
+                            validate_https___example_com_schemas_aave_hf_snapshot_schema_json___defs_decimalstring(data__user__stresstests__hfminus3pct, custom_formats, (name_prefix or "data") + ".user.stress_tests.hf_minus_3pct")
+                        if "hf_minus_5pct" in data__user__stresstests_keys:
+                            data__user__stresstests_keys.remove("hf_minus_5pct")
+                            data__user__stresstests__hfminus5pct = data__user__stresstests["hf_minus_5pct"]
+                            validate_https___example_com_schemas_aave_hf_snapshot_schema_json___defs_decimalstring(data__user__stresstests__hfminus5pct, custom_formats, (name_prefix or "data") + ".user.stress_tests.hf_minus_5pct")
+                        if data__user__stresstests_keys:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".user.stress_tests must not contain "+str(data__user__stresstests_keys)+" properties", value=data__user__stresstests, name="" + (name_prefix or "data") + ".user.stress_tests", definition={'type': 'object', 'additionalProperties': False, 'required': ['hf_minus_1pct', 'hf_minus_3pct', 'hf_minus_5pct'], 'properties': {'hf_minus_1pct': {'type': 'string', 'pattern': '^-?(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'hf_minus_3pct': {'type': 'string', 'pattern': '^-?(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'hf_minus_5pct': {'type': 'string', 'pattern': '^-?(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}}}, rule='additionalProperties')
+                if data__user_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".user must not contain "+str(data__user_keys)+" properties", value=data__user, name="" + (name_prefix or "data") + ".user", definition={'type': 'object', 'additionalProperties': False, 'required': ['health_factor', 'ltv', 'liquidation_threshold', 'liquidation_buffer_usd', 'available_borrows_usd', 'risk_class', 'is_safe', 'stress_tests'], 'properties': {'health_factor': {'type': 'string', 'pattern': '^-?(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'ltv': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'liquidation_threshold': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'liquidation_buffer_usd': {'type': 'string', 'pattern': '^-?(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'available_borrows_usd': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'risk_class': {'type': 'string', 'enum': ['low', 'moderate', 'high']}, 'is_safe': {'type': 'boolean'}, 'stress_tests': {'type': 'object', 'additionalProperties': False, 'required': ['hf_minus_1pct', 'hf_minus_3pct', 'hf_minus_5pct'], 'properties': {'hf_minus_1pct': {'type': 'string', 'pattern': '^-?(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'hf_minus_3pct': {'type': 'string', 'pattern': '^-?(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'hf_minus_5pct': {'type': 'string', 'pattern': '^-?(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}}}}}, rule='additionalProperties')
+        if "totals" in data_keys:
+            data_keys.remove("totals")
+            data__totals = data["totals"]
+            if not isinstance(data__totals, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".totals must be object", value=data__totals, name="" + (name_prefix or "data") + ".totals", definition={'type': 'object', 'additionalProperties': False, 'required': ['total_collateral_usd', 'total_debt_usd', 'net_equity_usd', 'current_leverage_ratio', 'max_leverage_at_current_hf'], 'properties': {'total_collateral_usd': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'total_debt_usd': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'net_equity_usd': {'type': 'string', 'pattern': '^-?(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'current_leverage_ratio': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'max_leverage_at_current_hf': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}}}, rule='type')
+            data__totals_is_dict = isinstance(data__totals, dict)
+            if data__totals_is_dict:
+                data__totals__missing_keys = set(['total_collateral_usd', 'total_debt_usd', 'net_equity_usd', 'current_leverage_ratio', 'max_leverage_at_current_hf']) - data__totals.keys()
+                if data__totals__missing_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".totals must contain " + (str(sorted(data__totals__missing_keys)) + " properties"), value=data__totals, name="" + (name_prefix or "data") + ".totals", definition={'type': 'object', 'additionalProperties': False, 'required': ['total_collateral_usd', 'total_debt_usd', 'net_equity_usd', 'current_leverage_ratio', 'max_leverage_at_current_hf'], 'properties': {'total_collateral_usd': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'total_debt_usd': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'net_equity_usd': {'type': 'string', 'pattern': '^-?(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'current_leverage_ratio': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'max_leverage_at_current_hf': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}}}, rule='required')
+                data__totals_keys = set(data__totals.keys())
+                if "total_collateral_usd" in data__totals_keys:
+                    data__totals_keys.remove("total_collateral_usd")
+                    data__totals__totalcollateralusd = data__totals["total_collateral_usd"]
+                    validate_https___example_com_schemas_aave_hf_snapshot_schema_json___defs_udecimalstring(data__totals__totalcollateralusd, custom_formats, (name_prefix or "data") + ".totals.total_collateral_usd")
+                if "total_debt_usd" in data__totals_keys:
+                    data__totals_keys.remove("total_debt_usd")
+                    data__totals__totaldebtusd = data__totals["total_debt_usd"]
+                    validate_https___example_com_schemas_aave_hf_snapshot_schema_json___defs_udecimalstring(data__totals__totaldebtusd, custom_formats, (name_prefix or "data") + ".totals.total_debt_usd")
+                if "net_equity_usd" in data__totals_keys:
+                    data__totals_keys.remove("net_equity_usd")
+                    data__totals__netequityusd = data__totals["net_equity_usd"]
+                    validate_https___example_com_schemas_aave_hf_snapshot_schema_json___defs_decimalstring(data__totals__netequityusd, custom_formats, (name_prefix or "data") + ".totals.net_equity_usd")
+                if "current_leverage_ratio" in data__totals_keys:
+                    data__totals_keys.remove("current_leverage_ratio")
+                    data__totals__currentleverageratio = data__totals["current_leverage_ratio"]
+                    validate_https___example_com_schemas_aave_hf_snapshot_schema_json___defs_udecimalstring(data__totals__currentleverageratio, custom_formats, (name_prefix or "data") + ".totals.current_leverage_ratio")
+                if "max_leverage_at_current_hf" in data__totals_keys:
+                    data__totals_keys.remove("max_leverage_at_current_hf")
+                    data__totals__maxleverageatcurrenthf = data__totals["max_leverage_at_current_hf"]
+                    validate_https___example_com_schemas_aave_hf_snapshot_schema_json___defs_udecimalstring(data__totals__maxleverageatcurrenthf, custom_formats, (name_prefix or "data") + ".totals.max_leverage_at_current_hf")
+                if data__totals_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".totals must not contain "+str(data__totals_keys)+" properties", value=data__totals, name="" + (name_prefix or "data") + ".totals", definition={'type': 'object', 'additionalProperties': False, 'required': ['total_collateral_usd', 'total_debt_usd', 'net_equity_usd', 'current_leverage_ratio', 'max_leverage_at_current_hf'], 'properties': {'total_collateral_usd': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'total_debt_usd': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'net_equity_usd': {'type': 'string', 'pattern': '^-?(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'current_leverage_ratio': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'max_leverage_at_current_hf': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}}}, rule='additionalProperties')
+        if "collateral" in data_keys:
+            data_keys.remove("collateral")
+            data__collateral = data["collateral"]
+            if not isinstance(data__collateral, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".collateral must be array", value=data__collateral, name="" + (name_prefix or "data") + ".collateral", definition={'type': 'array', 'items': {'type': 'object', 'additionalProperties': False, 'required': ['token', 'amount', 'amount_usd', 'price_usd', 'usage_as_collateral_enabled', 'reserve_ltv', 'reserve_liquidation_threshold', 'reserve_liquidation_bonus', 'emode_category'], 'properties': {'token': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/token'}, 'amount': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}, 'amount_usd': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}, 'price_usd': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}, 'usage_as_collateral_enabled': {'type': 'boolean'}, 'reserve_ltv': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}, 'reserve_liquidation_threshold': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}, 'reserve_liquidation_bonus': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}, 'emode_category': {'type': ['string', 'null'], 'pattern': '^[0-9]+$'}}}}, rule='type')
+            data__collateral_is_list = isinstance(data__collateral, (list, tuple))
+            if data__collateral_is_list:
+                data__collateral_len = len(data__collateral)
+                for data__collateral_x, data__collateral_item in enumerate(data__collateral):
+                    validate_https___example_com_schemas_aave_hf_snapshot_schema_json___defs_collateralitem(data__collateral_item, custom_formats, (name_prefix or "data") + ".collateral[{data__collateral_x}]".format(**locals()))
+        if "debt" in data_keys:
+            data_keys.remove("debt")
+            data__debt = data["debt"]
+            if not isinstance(data__debt, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".debt must be array", value=data__debt, name="" + (name_prefix or "data") + ".debt", definition={'type': 'array', 'items': {'type': 'object', 'additionalProperties': False, 'required': ['token', 'variable_debt', 'stable_debt', 'total_debt_usd', 'variable_borrow_apy', 'stable_borrow_apy', 'reserve_utilization', 'borrow_cap', 'borrow_cap_used_percent'], 'properties': {'token': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/token'}, 'variable_debt': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}, 'stable_debt': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}, 'total_debt_usd': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}, 'variable_borrow_apy': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}, 'stable_borrow_apy': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}, 'reserve_utilization': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}, 'borrow_cap': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)$'}, 'borrow_cap_used_percent': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}}}}, rule='type')
+            data__debt_is_list = isinstance(data__debt, (list, tuple))
+            if data__debt_is_list:
+                data__debt_len = len(data__debt)
+                for data__debt_x, data__debt_item in enumerate(data__debt):
+                    validate_https___example_com_schemas_aave_hf_snapshot_schema_json___defs_debtitem(data__debt_item, custom_formats, (name_prefix or "data") + ".debt[{data__debt_x}]".format(**locals()))
+        if "oracles" in data_keys:
+            data_keys.remove("oracles")
+            data__oracles = data["oracles"]
+            if not isinstance(data__oracles, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".oracles must be object", value=data__oracles, name="" + (name_prefix or "data") + ".oracles", definition={'type': 'object', 'additionalProperties': False, 'required': ['base_currency', 'assets'], 'properties': {'base_currency': {'type': 'object', 'additionalProperties': False, 'required': ['symbol', 'price_usd', 'last_update'], 'properties': {'symbol': {'type': 'string'}, 'price_usd': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'last_update': {'type': 'integer', 'minimum': 0}}}, 'assets': {'type': 'array', 'items': {'type': 'object', 'additionalProperties': False, 'required': ['token', 'price_usd', 'last_update', 'confidence_score'], 'properties': {'token': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/token'}, 'price_usd': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}, 'last_update': {'type': 'integer', 'minimum': 0}, 'confidence_score': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}}}}}}, rule='type')
+            data__oracles_is_dict = isinstance(data__oracles, dict)
+            if data__oracles_is_dict:
+                data__oracles__missing_keys = set(['base_currency', 'assets']) - data__oracles.keys()
+                if data__oracles__missing_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".oracles must contain " + (str(sorted(data__oracles__missing_keys)) + " properties"), value=data__oracles, name="" + (name_prefix or "data") + ".oracles", definition={'type': 'object', 'additionalProperties': False, 'required': ['base_currency', 'assets'], 'properties': {'base_currency': {'type': 'object', 'additionalProperties': False, 'required': ['symbol', 'price_usd', 'last_update'], 'properties': {'symbol': {'type': 'string'}, 'price_usd': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'last_update': {'type': 'integer', 'minimum': 0}}}, 'assets': {'type': 'array', 'items': {'type': 'object', 'additionalProperties': False, 'required': ['token', 'price_usd', 'last_update', 'confidence_score'], 'properties': {'token': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/token'}, 'price_usd': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}, 'last_update': {'type': 'integer', 'minimum': 0}, 'confidence_score': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}}}}}}, rule='required')
+                data__oracles_keys = set(data__oracles.keys())
+                if "base_currency" in data__oracles_keys:
+                    data__oracles_keys.remove("base_currency")
+                    data__oracles__basecurrency = data__oracles["base_currency"]
+                    if not isinstance(data__oracles__basecurrency, (dict)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".oracles.base_currency must be object", value=data__oracles__basecurrency, name="" + (name_prefix or "data") + ".oracles.base_currency", definition={'type': 'object', 'additionalProperties': False, 'required': ['symbol', 'price_usd', 'last_update'], 'properties': {'symbol': {'type': 'string'}, 'price_usd': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'last_update': {'type': 'integer', 'minimum': 0}}}, rule='type')
+                    data__oracles__basecurrency_is_dict = isinstance(data__oracles__basecurrency, dict)
+                    if data__oracles__basecurrency_is_dict:
+                        data__oracles__basecurrency__missing_keys = set(['symbol', 'price_usd', 'last_update']) - data__oracles__basecurrency.keys()
+                        if data__oracles__basecurrency__missing_keys:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".oracles.base_currency must contain " + (str(sorted(data__oracles__basecurrency__missing_keys)) + " properties"), value=data__oracles__basecurrency, name="" + (name_prefix or "data") + ".oracles.base_currency", definition={'type': 'object', 'additionalProperties': False, 'required': ['symbol', 'price_usd', 'last_update'], 'properties': {'symbol': {'type': 'string'}, 'price_usd': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'last_update': {'type': 'integer', 'minimum': 0}}}, rule='required')
+                        data__oracles__basecurrency_keys = set(data__oracles__basecurrency.keys())
+                        if "symbol" in data__oracles__basecurrency_keys:
+                            data__oracles__basecurrency_keys.remove("symbol")
+                            data__oracles__basecurrency__symbol = data__oracles__basecurrency["symbol"]
+                            if not isinstance(data__oracles__basecurrency__symbol, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".oracles.base_currency.symbol must be string", value=data__oracles__basecurrency__symbol, name="" + (name_prefix or "data") + ".oracles.base_currency.symbol", definition={'type': 'string'}, rule='type')
+                        if "price_usd" in data__oracles__basecurrency_keys:
+                            data__oracles__basecurrency_keys.remove("price_usd")
+                            data__oracles__basecurrency__priceusd = data__oracles__basecurrency["price_usd"]
+                            validate_https___example_com_schemas_aave_hf_snapshot_schema_json___defs_udecimalstring(data__oracles__basecurrency__priceusd, custom_formats, (name_prefix or "data") + ".oracles.base_currency.price_usd")
+                        if "last_update" in data__oracles__basecurrency_keys:
+                            data__oracles__basecurrency_keys.remove("last_update")
+                            data__oracles__basecurrency__lastupdate = data__oracles__basecurrency["last_update"]
+                            if not isinstance(data__oracles__basecurrency__lastupdate, (int)) and not (isinstance(data__oracles__basecurrency__lastupdate, float) and data__oracles__basecurrency__lastupdate.is_integer()) or isinstance(data__oracles__basecurrency__lastupdate, bool):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".oracles.base_currency.last_update must be integer", value=data__oracles__basecurrency__lastupdate, name="" + (name_prefix or "data") + ".oracles.base_currency.last_update", definition={'type': 'integer', 'minimum': 0}, rule='type')
+                            if isinstance(data__oracles__basecurrency__lastupdate, (int, float, Decimal)):
+                                if data__oracles__basecurrency__lastupdate < 0:
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".oracles.base_currency.last_update must be bigger than or equal to 0", value=data__oracles__basecurrency__lastupdate, name="" + (name_prefix or "data") + ".oracles.base_currency.last_update", definition={'type': 'integer', 'minimum': 0}, rule='minimum')
+                        if data__oracles__basecurrency_keys:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".oracles.base_currency must not contain "+str(data__oracles__basecurrency_keys)+" properties", value=data__oracles__basecurrency, name="" + (name_prefix or "data") + ".oracles.base_currency", definition={'type': 'object', 'additionalProperties': False, 'required': ['symbol', 'price_usd', 'last_update'], 'properties': {'symbol': {'type': 'string'}, 'price_usd': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'last_update': {'type': 'integer', 'minimum': 0}}}, rule='additionalProperties')
+                if "assets" in data__oracles_keys:
+                    data__oracles_keys.remove("assets")
+                    data__oracles__assets = data__oracles["assets"]
+                    if not isinstance(data__oracles__assets, (list, tuple)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".oracles.assets must be array", value=data__oracles__assets, name="" + (name_prefix or "data") + ".oracles.assets", definition={'type': 'array', 'items': {'type': 'object', 'additionalProperties': False, 'required': ['token', 'price_usd', 'last_update', 'confidence_score'], 'properties': {'token': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/token'}, 'price_usd': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}, 'last_update': {'type': 'integer', 'minimum': 0}, 'confidence_score': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}}}}, rule='type')
+                    data__oracles__assets_is_list = isinstance(data__oracles__assets, (list, tuple))
+                    if data__oracles__assets_is_list:
+                        data__oracles__assets_len = len(data__oracles__assets)
+                        for data__oracles__assets_x, data__oracles__assets_item in enumerate(data__oracles__assets):
+                            validate_https___example_com_schemas_aave_hf_snapshot_schema_json___defs_oracleasset(data__oracles__assets_item, custom_formats, (name_prefix or "data") + ".oracles.assets[{data__oracles__assets_x}]".format(**locals()))
+                if data__oracles_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".oracles must not contain "+str(data__oracles_keys)+" properties", value=data__oracles, name="" + (name_prefix or "data") + ".oracles", definition={'type': 'object', 'additionalProperties': False, 'required': ['base_currency', 'assets'], 'properties': {'base_currency': {'type': 'object', 'additionalProperties': False, 'required': ['symbol', 'price_usd', 'last_update'], 'properties': {'symbol': {'type': 'string'}, 'price_usd': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'last_update': {'type': 'integer', 'minimum': 0}}}, 'assets': {'type': 'array', 'items': {'type': 'object', 'additionalProperties': False, 'required': ['token', 'price_usd', 'last_update', 'confidence_score'], 'properties': {'token': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/token'}, 'price_usd': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}, 'last_update': {'type': 'integer', 'minimum': 0}, 'confidence_score': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}}}}}}, rule='additionalProperties')
+        if "config" in data_keys:
+            data_keys.remove("config")
+            data__config = data["config"]
+            if not isinstance(data__config, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".config must be object", value=data__config, name="" + (name_prefix or "data") + ".config", definition={'type': 'object', 'additionalProperties': False, 'required': ['emode', 'isolation_mode', 'caps'], 'properties': {'emode': {'type': 'object', 'additionalProperties': False, 'required': ['active', 'category', 'settings'], 'properties': {'active': {'type': 'boolean'}, 'category': {'type': ['string', 'null']}, 'settings': {'type': ['object', 'null']}}}, 'isolation_mode': {'type': 'object', 'additionalProperties': False, 'required': ['active', 'debt_ceiling_remaining_usd'], 'properties': {'active': {'type': 'boolean'}, 'debt_ceiling_remaining_usd': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}}}, 'caps': {'type': 'array', 'items': {'type': 'object', 'additionalProperties': False, 'required': ['token', 'supply_cap', 'supply_cap_used_percent', 'borrow_cap', 'borrow_cap_used_percent'], 'properties': {'token': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/token'}, 'supply_cap': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)$'}, 'supply_cap_used_percent': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}, 'borrow_cap': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)$'}, 'borrow_cap_used_percent': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}}}}}}, rule='type')
+            data__config_is_dict = isinstance(data__config, dict)
+            if data__config_is_dict:
+                data__config__missing_keys = set(['emode', 'isolation_mode', 'caps']) - data__config.keys()
+                if data__config__missing_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".config must contain " + (str(sorted(data__config__missing_keys)) + " properties"), value=data__config, name="" + (name_prefix or "data") + ".config", definition={'type': 'object', 'additionalProperties': False, 'required': ['emode', 'isolation_mode', 'caps'], 'properties': {'emode': {'type': 'object', 'additionalProperties': False, 'required': ['active', 'category', 'settings'], 'properties': {'active': {'type': 'boolean'}, 'category': {'type': ['string', 'null']}, 'settings': {'type': ['object', 'null']}}}, 'isolation_mode': {'type': 'object', 'additionalProperties': False, 'required': ['active', 'debt_ceiling_remaining_usd'], 'properties': {'active': {'type': 'boolean'}, 'debt_ceiling_remaining_usd': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}}}, 'caps': {'type': 'array', 'items': {'type': 'object', 'additionalProperties': False, 'required': ['token', 'supply_cap', 'supply_cap_used_percent', 'borrow_cap', 'borrow_cap_used_percent'], 'properties': {'token': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/token'}, 'supply_cap': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)$'}, 'supply_cap_used_percent': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}, 'borrow_cap': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)$'}, 'borrow_cap_used_percent': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}}}}}}, rule='required')
+                data__config_keys = set(data__config.keys())
+                if "emode" in data__config_keys:
+                    data__config_keys.remove("emode")
+                    data__config__emode = data__config["emode"]
+                    if not isinstance(data__config__emode, (dict)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".config.emode must be object", value=data__config__emode, name="" + (name_prefix or "data") + ".config.emode", definition={'type': 'object', 'additionalProperties': False, 'required': ['active', 'category', 'settings'], 'properties': {'active': {'type': 'boolean'}, 'category': {'type': ['string', 'null']}, 'settings': {'type': ['object', 'null']}}}, rule='type')
+                    data__config__emode_is_dict = isinstance(data__config__emode, dict)
+                    if data__config__emode_is_dict:
+                        data__config__emode__missing_keys = set(['active', 'category', 'settings']) - data__config__emode.keys()
+                        if data__config__emode__missing_keys:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".config.emode must contain " + (str(sorted(data__config__emode__missing_keys)) + " properties"), value=data__config__emode, name="" + (name_prefix or "data") + ".config.emode", definition={'type': 'object', 'additionalProperties': False, 'required': ['active', 'category', 'settings'], 'properties': {'active': {'type': 'boolean'}, 'category': {'type': ['string', 'null']}, 'settings': {'type': ['object', 'null']}}}, rule='required')
+                        data__config__emode_keys = set(data__config__emode.keys())
+                        if "active" in data__config__emode_keys:
+                            data__config__emode_keys.remove("active")
+                            data__config__emode__active = data__config__emode["active"]
+                            if not isinstance(data__config__emode__active, (bool)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".config.emode.active must be boolean", value=data__config__emode__active, name="" + (name_prefix or "data") + ".config.emode.active", definition={'type': 'boolean'}, rule='type')
+                        if "category" in data__config__emode_keys:
+                            data__config__emode_keys.remove("category")
+                            data__config__emode__category = data__config__emode["category"]
+                            if not isinstance(data__config__emode__category, (str, NoneType)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".config.emode.category must be string or null", value=data__config__emode__category, name="" + (name_prefix or "data") + ".config.emode.category", definition={'type': ['string', 'null']}, rule='type')
+                        if "settings" in data__config__emode_keys:
+                            data__config__emode_keys.remove("settings")
+                            data__config__emode__settings = data__config__emode["settings"]
+                            if not isinstance(data__config__emode__settings, (dict, NoneType)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".config.emode.settings must be object or null", value=data__config__emode__settings, name="" + (name_prefix or "data") + ".config.emode.settings", definition={'type': ['object', 'null']}, rule='type')
+                        if data__config__emode_keys:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".config.emode must not contain "+str(data__config__emode_keys)+" properties", value=data__config__emode, name="" + (name_prefix or "data") + ".config.emode", definition={'type': 'object', 'additionalProperties': False, 'required': ['active', 'category', 'settings'], 'properties': {'active': {'type': 'boolean'}, 'category': {'type': ['string', 'null']}, 'settings': {'type': ['object', 'null']}}}, rule='additionalProperties')
+                if "isolation_mode" in data__config_keys:
+                    data__config_keys.remove("isolation_mode")
+                    data__config__isolationmode = data__config["isolation_mode"]
+                    if not isinstance(data__config__isolationmode, (dict)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".config.isolation_mode must be object", value=data__config__isolationmode, name="" + (name_prefix or "data") + ".config.isolation_mode", definition={'type': 'object', 'additionalProperties': False, 'required': ['active', 'debt_ceiling_remaining_usd'], 'properties': {'active': {'type': 'boolean'}, 'debt_ceiling_remaining_usd': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}}}, rule='type')
+                    data__config__isolationmode_is_dict = isinstance(data__config__isolationmode, dict)
+                    if data__config__isolationmode_is_dict:
+                        data__config__isolationmode__missing_keys = set(['active', 'debt_ceiling_remaining_usd']) - data__config__isolationmode.keys()
+                        if data__config__isolationmode__missing_keys:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".config.isolation_mode must contain " + (str(sorted(data__config__isolationmode__missing_keys)) + " properties"), value=data__config__isolationmode, name="" + (name_prefix or "data") + ".config.isolation_mode", definition={'type': 'object', 'additionalProperties': False, 'required': ['active', 'debt_ceiling_remaining_usd'], 'properties': {'active': {'type': 'boolean'}, 'debt_ceiling_remaining_usd': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}}}, rule='required')
+                        data__config__isolationmode_keys = set(data__config__isolationmode.keys())
+                        if "active" in data__config__isolationmode_keys:
+                            data__config__isolationmode_keys.remove("active")
+                            data__config__isolationmode__active = data__config__isolationmode["active"]
+                            if not isinstance(data__config__isolationmode__active, (bool)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".config.isolation_mode.active must be boolean", value=data__config__isolationmode__active, name="" + (name_prefix or "data") + ".config.isolation_mode.active", definition={'type': 'boolean'}, rule='type')
+                        if "debt_ceiling_remaining_usd" in data__config__isolationmode_keys:
+                            data__config__isolationmode_keys.remove("debt_ceiling_remaining_usd")
+                            data__config__isolationmode__debtceilingremainingusd = data__config__isolationmode["debt_ceiling_remaining_usd"]
+                            validate_https___example_com_schemas_aave_hf_snapshot_schema_json___defs_udecimalstring(data__config__isolationmode__debtceilingremainingusd, custom_formats, (name_prefix or "data") + ".config.isolation_mode.debt_ceiling_remaining_usd")
+                        if data__config__isolationmode_keys:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".config.isolation_mode must not contain "+str(data__config__isolationmode_keys)+" properties", value=data__config__isolationmode, name="" + (name_prefix or "data") + ".config.isolation_mode", definition={'type': 'object', 'additionalProperties': False, 'required': ['active', 'debt_ceiling_remaining_usd'], 'properties': {'active': {'type': 'boolean'}, 'debt_ceiling_remaining_usd': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}}}, rule='additionalProperties')
+                if "caps" in data__config_keys:
+                    data__config_keys.remove("caps")
+                    data__config__caps = data__config["caps"]
+                    if not isinstance(data__config__caps, (list, tuple)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".config.caps must be array", value=data__config__caps, name="" + (name_prefix or "data") + ".config.caps", definition={'type': 'array', 'items': {'type': 'object', 'additionalProperties': False, 'required': ['token', 'supply_cap', 'supply_cap_used_percent', 'borrow_cap', 'borrow_cap_used_percent'], 'properties': {'token': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/token'}, 'supply_cap': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)$'}, 'supply_cap_used_percent': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}, 'borrow_cap': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)$'}, 'borrow_cap_used_percent': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}}}}, rule='type')
+                    data__config__caps_is_list = isinstance(data__config__caps, (list, tuple))
+                    if data__config__caps_is_list:
+                        data__config__caps_len = len(data__config__caps)
+                        for data__config__caps_x, data__config__caps_item in enumerate(data__config__caps):
+                            validate_https___example_com_schemas_aave_hf_snapshot_schema_json___defs_capitem(data__config__caps_item, custom_formats, (name_prefix or "data") + ".config.caps[{data__config__caps_x}]".format(**locals()))
+                if data__config_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".config must not contain "+str(data__config_keys)+" properties", value=data__config, name="" + (name_prefix or "data") + ".config", definition={'type': 'object', 'additionalProperties': False, 'required': ['emode', 'isolation_mode', 'caps'], 'properties': {'emode': {'type': 'object', 'additionalProperties': False, 'required': ['active', 'category', 'settings'], 'properties': {'active': {'type': 'boolean'}, 'category': {'type': ['string', 'null']}, 'settings': {'type': ['object', 'null']}}}, 'isolation_mode': {'type': 'object', 'additionalProperties': False, 'required': ['active', 'debt_ceiling_remaining_usd'], 'properties': {'active': {'type': 'boolean'}, 'debt_ceiling_remaining_usd': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}}}, 'caps': {'type': 'array', 'items': {'type': 'object', 'additionalProperties': False, 'required': ['token', 'supply_cap', 'supply_cap_used_percent', 'borrow_cap', 'borrow_cap_used_percent'], 'properties': {'token': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/token'}, 'supply_cap': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)$'}, 'supply_cap_used_percent': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}, 'borrow_cap': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)$'}, 'borrow_cap_used_percent': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}}}}}}, rule='additionalProperties')
+        if "meta" in data_keys:
+            data_keys.remove("meta")
+            data__meta = data["meta"]
+            if not isinstance(data__meta, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".meta must be object", value=data__meta, name="" + (name_prefix or "data") + ".meta", definition={'type': 'object', 'additionalProperties': False, 'required': ['data_provider', 'oracle_source', 'latency_ms', 'version'], 'properties': {'data_provider': {'type': 'string'}, 'oracle_source': {'type': 'string'}, 'latency_ms': {'type': 'integer', 'minimum': 0}, 'version': {'type': 'string'}}}, rule='type')
+            data__meta_is_dict = isinstance(data__meta, dict)
+            if data__meta_is_dict:
+                data__meta__missing_keys = set(['data_provider', 'oracle_source', 'latency_ms', 'version']) - data__meta.keys()
+                if data__meta__missing_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".meta must contain " + (str(sorted(data__meta__missing_keys)) + " properties"), value=data__meta, name="" + (name_prefix or "data") + ".meta", definition={'type': 'object', 'additionalProperties': False, 'required': ['data_provider', 'oracle_source', 'latency_ms', 'version'], 'properties': {'data_provider': {'type': 'string'}, 'oracle_source': {'type': 'string'}, 'latency_ms': {'type': 'integer', 'minimum': 0}, 'version': {'type': 'string'}}}, rule='required')
+                data__meta_keys = set(data__meta.keys())
+                if "data_provider" in data__meta_keys:
+                    data__meta_keys.remove("data_provider")
+                    data__meta__dataprovider = data__meta["data_provider"]
+                    if not isinstance(data__meta__dataprovider, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".meta.data_provider must be string", value=data__meta__dataprovider, name="" + (name_prefix or "data") + ".meta.data_provider", definition={'type': 'string'}, rule='type')
+                if "oracle_source" in data__meta_keys:
+                    data__meta_keys.remove("oracle_source")
+                    data__meta__oraclesource = data__meta["oracle_source"]
+                    if not isinstance(data__meta__oraclesource, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".meta.oracle_source must be string", value=data__meta__oraclesource, name="" + (name_prefix or "data") + ".meta.oracle_source", definition={'type': 'string'}, rule='type')
+                if "latency_ms" in data__meta_keys:
+                    data__meta_keys.remove("latency_ms")
+                    data__meta__latencyms = data__meta["latency_ms"]
+                    if not isinstance(data__meta__latencyms, (int)) and not (isinstance(data__meta__latencyms, float) and data__meta__latencyms.is_integer()) or isinstance(data__meta__latencyms, bool):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".meta.latency_ms must be integer", value=data__meta__latencyms, name="" + (name_prefix or "data") + ".meta.latency_ms", definition={'type': 'integer', 'minimum': 0}, rule='type')
+                    if isinstance(data__meta__latencyms, (int, float, Decimal)):
+                        if data__meta__latencyms < 0:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".meta.latency_ms must be bigger than or equal to 0", value=data__meta__latencyms, name="" + (name_prefix or "data") + ".meta.latency_ms", definition={'type': 'integer', 'minimum': 0}, rule='minimum')
+                if "version" in data__meta_keys:
+                    data__meta_keys.remove("version")
+                    data__meta__version = data__meta["version"]
+                    if not isinstance(data__meta__version, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".meta.version must be string", value=data__meta__version, name="" + (name_prefix or "data") + ".meta.version", definition={'type': 'string'}, rule='type')
+                if data__meta_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".meta must not contain "+str(data__meta_keys)+" properties", value=data__meta, name="" + (name_prefix or "data") + ".meta", definition={'type': 'object', 'additionalProperties': False, 'required': ['data_provider', 'oracle_source', 'latency_ms', 'version'], 'properties': {'data_provider': {'type': 'string'}, 'oracle_source': {'type': 'string'}, 'latency_ms': {'type': 'integer', 'minimum': 0}, 'version': {'type': 'string'}}}, rule='additionalProperties')
+        if data_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must not contain "+str(data_keys)+" properties", value=data, name="" + (name_prefix or "data") + "", definition={'$schema': 'http://json-schema.org/draft-07/schema#', '$id': 'https://example.com/schemas/aave-hf-snapshot.schema.json', 'title': 'AAVE v3 Health Factor Snapshot (Base)', 'type': 'object', 'additionalProperties': False, 'required': ['network', 'chain_id', 'address', 'timestamp', 'user', 'totals', 'collateral', 'debt', 'oracles', 'config', 'meta'], 'properties': {'network': {'const': 'base'}, 'chain_id': {'type': 'integer', 'const': 8453}, 'address': {'type': 'string', 'pattern': '^0x[0-9a-fA-F]{40}$'}, 'timestamp': {'type': 'integer', 'minimum': 0}, 'user': {'type': 'object', 'additionalProperties': False, 'required': ['health_factor', 'ltv', 'liquidation_threshold', 'liquidation_buffer_usd', 'available_borrows_usd', 'risk_class', 'is_safe', 'stress_tests'], 'properties': {'health_factor': {'type': 'string', 'pattern': '^-?(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'ltv': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'liquidation_threshold': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'liquidation_buffer_usd': {'type': 'string', 'pattern': '^-?(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'available_borrows_usd': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'risk_class': {'type': 'string', 'enum': ['low', 'moderate', 'high']}, 'is_safe': {'type': 'boolean'}, 'stress_tests': {'type': 'object', 'additionalProperties': False, 'required': ['hf_minus_1pct', 'hf_minus_3pct', 'hf_minus_5pct'], 'properties': {'hf_minus_1pct': {'type': 'string', 'pattern': '^-?(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'hf_minus_3pct': {'type': 'string', 'pattern': '^-?(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'hf_minus_5pct': {'type': 'string', 'pattern': '^-?(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}}}}}, 'totals': {'type': 'object', 'additionalProperties': False, 'required': ['total_collateral_usd', 'total_debt_usd', 'net_equity_usd', 'current_leverage_ratio', 'max_leverage_at_current_hf'], 'properties': {'total_collateral_usd': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'total_debt_usd': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'net_equity_usd': {'type': 'string', 'pattern': '^-?(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'current_leverage_ratio': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'max_leverage_at_current_hf': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}}}, 'collateral': {'type': 'array', 'items': {'type': 'object', 'additionalProperties': False, 'required': ['token', 'amount', 'amount_usd', 'price_usd', 'usage_as_collateral_enabled', 'reserve_ltv', 'reserve_liquidation_threshold', 'reserve_liquidation_bonus', 'emode_category'], 'properties': {'token': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/token'}, 'amount': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}, 'amount_usd': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}, 'price_usd': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}, 'usage_as_collateral_enabled': {'type': 'boolean'}, 'reserve_ltv': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}, 'reserve_liquidation_threshold': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}, 'reserve_liquidation_bonus': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}, 'emode_category': {'type': ['string', 'null'], 'pattern': '^[0-9]+$'}}}}, 'debt': {'type': 'array', 'items': {'type': 'object', 'additionalProperties': False, 'required': ['token', 'variable_debt', 'stable_debt', 'total_debt_usd', 'variable_borrow_apy', 'stable_borrow_apy', 'reserve_utilization', 'borrow_cap', 'borrow_cap_used_percent'], 'properties': {'token': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/token'}, 'variable_debt': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}, 'stable_debt': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}, 'total_debt_usd': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}, 'variable_borrow_apy': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}, 'stable_borrow_apy': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}, 'reserve_utilization': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}, 'borrow_cap': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)$'}, 'borrow_cap_used_percent': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}}}}, 'oracles': {'type': 'object', 'additionalProperties': False, 'required': ['base_currency', 'assets'], 'properties': {'base_currency': {'type': 'object', 'additionalProperties': False, 'required': ['symbol', 'price_usd', 'last_update'], 'properties': {'symbol': {'type': 'string'}, 'price_usd': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'last_update': {'type': 'integer', 'minimum': 0}}}, 'assets': {'type': 'array', 'items': {'type': 'object', 'additionalProperties': False, 'required': ['token', 'price_usd', 'last_update', 'confidence_score'], 'properties': {'token': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/token'}, 'price_usd': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}, 'last_update': {'type': 'integer', 'minimum': 0}, 'confidence_score': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}}}}}}, 'config': {'type': 'object', 'additionalProperties': False, 'required': ['emode', 'isolation_mode', 'caps'], 'properties': {'emode': {'type': 'object', 'additionalProperties': False, 'required': ['active', 'category', 'settings'], 'properties': {'active': {'type': 'boolean'}, 'category': {'type': ['string', 'null']}, 'settings': {'type': ['object', 'null']}}}, 'isolation_mode': {'type': 'object', 'additionalProperties': False, 'required': ['active', 'debt_ceiling_remaining_usd'], 'properties': {'active': {'type': 'boolean'}, 'debt_ceiling_remaining_usd': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}}}, 'caps': {'type': 'array', 'items': {'type': 'object', 'additionalProperties': False, 'required': ['token', 'supply_cap', 'supply_cap_used_percent', 'borrow_cap', 'borrow_cap_used_percent'], 'properties': {'token': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/token'}, 'supply_cap': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)$'}, 'supply_cap_used_percent': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}, 'borrow_cap': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)$'}, 'borrow_cap_used_percent': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/udecimalString'}}}}}}, 'meta': {'type': 'object', 'additionalProperties': False, 'required': ['data_provider', 'oracle_source', 'latency_ms', 'version'], 'properties': {'data_provider': {'type': 'string'}, 'oracle_source': {'type': 'string'}, 'latency_ms': {'type': 'integer', 'minimum': 0}, 'version': {'type': 'string'}}}}, '$defs': {'address': {'type': 'string', 'pattern': '^0x[0-9a-fA-F]{40}$'}, 'decimalString': {'type': 'string', 'pattern': '^-?(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'udecimalString': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'token': {'type': 'object', 'additionalProperties': False, 'required': ['symbol', 'address', 'decimals'], 'properties': {'symbol': {'type': 'string'}, 'address': {'type': 'string', 'pattern': '^0x[0-9a-fA-F]{40}$'}, 'decimals': {'type': 'integer', 'minimum': 0, 'maximum': 255}}}, 'collateralItem': {'type': 'object', 'additionalProperties': False, 'required': ['token', 'amount', 'amount_usd', 'price_usd', 'usage_as_collateral_enabled', 'reserve_ltv', 'reserve_liquidation_threshold', 'reserve_liquidation_bonus', 'emode_category'], 'properties': {'token': {'type': 'object', 'additionalProperties': False, 'required': ['symbol', 'address', 'decimals'], 'properties': {'symbol': {'type': 'string'}, 'address': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/address'}, 'decimals': {'type': 'integer', 'minimum': 0, 'maximum': 255}}}, 'amount': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'amount_usd': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'price_usd': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'usage_as_collateral_enabled': {'type': 'boolean'}, 'reserve_ltv': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'reserve_liquidation_threshold': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'reserve_liquidation_bonus': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'emode_category': {'type': ['string', 'null'], 'pattern': '^[0-9]+$'}}}, 'debtItem': {'type': 'object', 'additionalProperties': False, 'required': ['token', 'variable_debt', 'stable_debt', 'total_debt_usd', 'variable_borrow_apy', 'stable_borrow_apy', 'reserve_utilization', 'borrow_cap', 'borrow_cap_used_percent'], 'properties': {'token': {'type': 'object', 'additionalProperties': False, 'required': ['symbol', 'address', 'decimals'], 'properties': {'symbol': {'type': 'string'}, 'address': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/address'}, 'decimals': {'type': 'integer', 'minimum': 0, 'maximum': 255}}}, 'variable_debt': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'stable_debt': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'total_debt_usd': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'variable_borrow_apy': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'stable_borrow_apy': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'reserve_utilization': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'borrow_cap': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)$'}, 'borrow_cap_used_percent': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}}}, 'oracleAsset': {'type': 'object', 'additionalProperties': False, 'required': ['token', 'price_usd', 'last_update', 'confidence_score'], 'properties': {'token': {'type': 'object', 'additionalProperties': False, 'required': ['symbol', 'address', 'decimals'], 'properties': {'symbol': {'type': 'string'}, 'address': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/address'}, 'decimals': {'type': 'integer', 'minimum': 0, 'maximum': 255}}}, 'price_usd': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'last_update': {'type': 'integer', 'minimum': 0}, 'confidence_score': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}}}, 'capItem': {'type': 'object', 'additionalProperties': False, 'required': ['token', 'supply_cap', 'supply_cap_used_percent', 'borrow_cap', 'borrow_cap_used_percent'], 'properties': {'token': {'type': 'object', 'additionalProperties': False, 'required': ['symbol', 'address', 'decimals'], 'properties': {'symbol': {'type': 'string'}, 'address': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/address'}, 'decimals': {'type': 'integer', 'minimum': 0, 'maximum': 255}}}, 'supply_cap': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)$'}, 'supply_cap_used_percent': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'borrow_cap': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)$'}, 'borrow_cap_used_percent': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}}}}, 'examples': [{'network': 'base', 'chain_id': 8453, 'address': '0x0000000000000000000000000000000000000000', 'timestamp': 1700000000, 'user': {'health_factor': '1.23', 'ltv': '0.72', 'liquidation_threshold': '0.78', 'liquidation_buffer_usd': '123.45', 'available_borrows_usd': '456.78', 'risk_class': 'moderate', 'is_safe': True, 'stress_tests': {'hf_minus_1pct': '1.21', 'hf_minus_3pct': '1.18', 'hf_minus_5pct': '1.17'}}, 'totals': {'total_collateral_usd': '1000.00', 'total_debt_usd': '600.00', 'net_equity_usd': '400.00', 'current_leverage_ratio': '2.50', 'max_leverage_at_current_hf': '4.00'}, 'collateral': [], 'debt': [], 'oracles': {'base_currency': {'symbol': 'ETH', 'price_usd': '2000.00', 'last_update': 1700000000}, 'assets': []}, 'config': {'emode': {'active': False, 'category': None, 'settings': None}, 'isolation_mode': {'active': False, 'debt_ceiling_remaining_usd': '0'}, 'caps': []}, 'meta': {'data_provider': 'aave-v3', 'oracle_source': 'aave-oracle', 'latency_ms': 10, 'version': '1.0.0'}}]}, rule='additionalProperties')
+    return data
+
+def validate_https___example_com_schemas_aave_hf_snapshot_schema_json___defs_capitem(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'additionalProperties': False, 'required': ['token', 'supply_cap', 'supply_cap_used_percent', 'borrow_cap', 'borrow_cap_used_percent'], 'properties': {'token': {'type': 'object', 'additionalProperties': False, 'required': ['symbol', 'address', 'decimals'], 'properties': {'symbol': {'type': 'string'}, 'address': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/address'}, 'decimals': {'type': 'integer', 'minimum': 0, 'maximum': 255}}}, 'supply_cap': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)$'}, 'supply_cap_used_percent': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'borrow_cap': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)$'}, 'borrow_cap_used_percent': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}}}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['token', 'supply_cap', 'supply_cap_used_percent', 'borrow_cap', 'borrow_cap_used_percent']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'additionalProperties': False, 'required': ['token', 'supply_cap', 'supply_cap_used_percent', 'borrow_cap', 'borrow_cap_used_percent'], 'properties': {'token': {'type': 'object', 'additionalProperties': False, 'required': ['symbol', 'address', 'decimals'], 'properties': {'symbol': {'type': 'string'}, 'address': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/address'}, 'decimals': {'type': 'integer', 'minimum': 0, 'maximum': 255}}}, 'supply_cap': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)$'}, 'supply_cap_used_percent': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'borrow_cap': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)$'}, 'borrow_cap_used_percent': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}}}, rule='required')
+        data_keys = set(data.keys())
+        if "token" in data_keys:
+            data_keys.remove("token")
+            data__token = data["token"]
+            validate_https___example_com_schemas_aave_hf_snapshot_schema_json___defs_token(data__token, custom_formats, (name_prefix or "data") + ".token")
+        if "supply_cap" in data_keys:
+            data_keys.remove("supply_cap")
+            data__supplycap = data["supply_cap"]
+            if not isinstance(data__supplycap, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".supply_cap must be string", value=data__supplycap, name="" + (name_prefix or "data") + ".supply_cap", definition={'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)$'}, rule='type')
+            if isinstance(data__supplycap, str):
+                if not REGEX_PATTERNS['^(?:0|[1-9]\\d*)$'].search(data__supplycap):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".supply_cap must match pattern ^(?:0|[1-9]\\d*)$", value=data__supplycap, name="" + (name_prefix or "data") + ".supply_cap", definition={'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)$'}, rule='pattern')
+        if "supply_cap_used_percent" in data_keys:
+            data_keys.remove("supply_cap_used_percent")
+            data__supplycapusedpercent = data["supply_cap_used_percent"]
+            validate_https___example_com_schemas_aave_hf_snapshot_schema_json___defs_udecimalstring(data__supplycapusedpercent, custom_formats, (name_prefix or "data") + ".supply_cap_used_percent")
+        if "borrow_cap" in data_keys:
+            data_keys.remove("borrow_cap")
+            data__borrowcap = data["borrow_cap"]
+            if not isinstance(data__borrowcap, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".borrow_cap must be string", value=data__borrowcap, name="" + (name_prefix or "data") + ".borrow_cap", definition={'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)$'}, rule='type')
+            if isinstance(data__borrowcap, str):
+                if not REGEX_PATTERNS['^(?:0|[1-9]\\d*)$'].search(data__borrowcap):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".borrow_cap must match pattern ^(?:0|[1-9]\\d*)$", value=data__borrowcap, name="" + (name_prefix or "data") + ".borrow_cap", definition={'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)$'}, rule='pattern')
+        if "borrow_cap_used_percent" in data_keys:
+            data_keys.remove("borrow_cap_used_percent")
+            data__borrowcapusedpercent = data["borrow_cap_used_percent"]
+            validate_https___example_com_schemas_aave_hf_snapshot_schema_json___defs_udecimalstring(data__borrowcapusedpercent, custom_formats, (name_prefix or "data") + ".borrow_cap_used_percent")
+        if data_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must not contain "+str(data_keys)+" properties", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'additionalProperties': False, 'required': ['token', 'supply_cap', 'supply_cap_used_percent', 'borrow_cap', 'borrow_cap_used_percent'], 'properties': {'token': {'type': 'object', 'additionalProperties': False, 'required': ['symbol', 'address', 'decimals'], 'properties': {'symbol': {'type': 'string'}, 'address': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/address'}, 'decimals': {'type': 'integer', 'minimum': 0, 'maximum': 255}}}, 'supply_cap': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)$'}, 'supply_cap_used_percent': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'borrow_cap': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)$'}, 'borrow_cap_used_percent': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}}}, rule='additionalProperties')
+    return data
+
+def validate_https___example_com_schemas_aave_hf_snapshot_schema_json___defs_token(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'additionalProperties': False, 'required': ['symbol', 'address', 'decimals'], 'properties': {'symbol': {'type': 'string'}, 'address': {'type': 'string', 'pattern': '^0x[0-9a-fA-F]{40}$'}, 'decimals': {'type': 'integer', 'minimum': 0, 'maximum': 255}}}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['symbol', 'address', 'decimals']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'additionalProperties': False, 'required': ['symbol', 'address', 'decimals'], 'properties': {'symbol': {'type': 'string'}, 'address': {'type': 'string', 'pattern': '^0x[0-9a-fA-F]{40}$'}, 'decimals': {'type': 'integer', 'minimum': 0, 'maximum': 255}}}, rule='required')
+        data_keys = set(data.keys())
+        if "symbol" in data_keys:
+            data_keys.remove("symbol")
+            data__symbol = data["symbol"]
+            if not isinstance(data__symbol, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".symbol must be string", value=data__symbol, name="" + (name_prefix or "data") + ".symbol", definition={'type': 'string'}, rule='type')
+        if "address" in data_keys:
+            data_keys.remove("address")
+            data__address = data["address"]
+            validate_https___example_com_schemas_aave_hf_snapshot_schema_json___defs_address(data__address, custom_formats, (name_prefix or "data") + ".address")
+        if "decimals" in data_keys:
+            data_keys.remove("decimals")
+            data__decimals = data["decimals"]
+            if not isinstance(data__decimals, (int)) and not (isinstance(data__decimals, float) and data__decimals.is_integer()) or isinstance(data__decimals, bool):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".decimals must be integer", value=data__decimals, name="" + (name_prefix or "data") + ".decimals", definition={'type': 'integer', 'minimum': 0, 'maximum': 255}, rule='type')
+            if isinstance(data__decimals, (int, float, Decimal)):
+                if data__decimals < 0:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".decimals must be bigger than or equal to 0", value=data__decimals, name="" + (name_prefix or "data") + ".decimals", definition={'type': 'integer', 'minimum': 0, 'maximum': 255}, rule='minimum')
+                if data__decimals > 255:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".decimals must be smaller than or equal to 255", value=data__decimals, name="" + (name_prefix or "data") + ".decimals", definition={'type': 'integer', 'minimum': 0, 'maximum': 255}, rule='maximum')
+        if data_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must not contain "+str(data_keys)+" properties", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'additionalProperties': False, 'required': ['symbol', 'address', 'decimals'], 'properties': {'symbol': {'type': 'string'}, 'address': {'type': 'string', 'pattern': '^0x[0-9a-fA-F]{40}$'}, 'decimals': {'type': 'integer', 'minimum': 0, 'maximum': 255}}}, rule='additionalProperties')
+    return data
+
+def validate_https___example_com_schemas_aave_hf_snapshot_schema_json___defs_oracleasset(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'additionalProperties': False, 'required': ['token', 'price_usd', 'last_update', 'confidence_score'], 'properties': {'token': {'type': 'object', 'additionalProperties': False, 'required': ['symbol', 'address', 'decimals'], 'properties': {'symbol': {'type': 'string'}, 'address': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/address'}, 'decimals': {'type': 'integer', 'minimum': 0, 'maximum': 255}}}, 'price_usd': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'last_update': {'type': 'integer', 'minimum': 0}, 'confidence_score': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}}}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['token', 'price_usd', 'last_update', 'confidence_score']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'additionalProperties': False, 'required': ['token', 'price_usd', 'last_update', 'confidence_score'], 'properties': {'token': {'type': 'object', 'additionalProperties': False, 'required': ['symbol', 'address', 'decimals'], 'properties': {'symbol': {'type': 'string'}, 'address': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/address'}, 'decimals': {'type': 'integer', 'minimum': 0, 'maximum': 255}}}, 'price_usd': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'last_update': {'type': 'integer', 'minimum': 0}, 'confidence_score': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}}}, rule='required')
+        data_keys = set(data.keys())
+        if "token" in data_keys:
+            data_keys.remove("token")
+            data__token = data["token"]
+            validate_https___example_com_schemas_aave_hf_snapshot_schema_json___defs_token(data__token, custom_formats, (name_prefix or "data") + ".token")
+        if "price_usd" in data_keys:
+            data_keys.remove("price_usd")
+            data__priceusd = data["price_usd"]
+            validate_https___example_com_schemas_aave_hf_snapshot_schema_json___defs_udecimalstring(data__priceusd, custom_formats, (name_prefix or "data") + ".price_usd")
+        if "last_update" in data_keys:
+            data_keys.remove("last_update")
+            data__lastupdate = data["last_update"]
+            if not isinstance(data__lastupdate, (int)) and not (isinstance(data__lastupdate, float) and data__lastupdate.is_integer()) or isinstance(data__lastupdate, bool):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".last_update must be integer", value=data__lastupdate, name="" + (name_prefix or "data") + ".last_update", definition={'type': 'integer', 'minimum': 0}, rule='type')
+            if isinstance(data__lastupdate, (int, float, Decimal)):
+                if data__lastupdate < 0:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".last_update must be bigger than or equal to 0", value=data__lastupdate, name="" + (name_prefix or "data") + ".last_update", definition={'type': 'integer', 'minimum': 0}, rule='minimum')
+        if "confidence_score" in data_keys:
+            data_keys.remove("confidence_score")
+            data__confidencescore = data["confidence_score"]
+            validate_https___example_com_schemas_aave_hf_snapshot_schema_json___defs_udecimalstring(data__confidencescore, custom_formats, (name_prefix or "data") + ".confidence_score")
+        if data_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must not contain "+str(data_keys)+" properties", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'additionalProperties': False, 'required': ['token', 'price_usd', 'last_update', 'confidence_score'], 'properties': {'token': {'type': 'object', 'additionalProperties': False, 'required': ['symbol', 'address', 'decimals'], 'properties': {'symbol': {'type': 'string'}, 'address': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/address'}, 'decimals': {'type': 'integer', 'minimum': 0, 'maximum': 255}}}, 'price_usd': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'last_update': {'type': 'integer', 'minimum': 0}, 'confidence_score': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}}}, rule='additionalProperties')
+    return data
+
+def validate_https___example_com_schemas_aave_hf_snapshot_schema_json___defs_debtitem(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'additionalProperties': False, 'required': ['token', 'variable_debt', 'stable_debt', 'total_debt_usd', 'variable_borrow_apy', 'stable_borrow_apy', 'reserve_utilization', 'borrow_cap', 'borrow_cap_used_percent'], 'properties': {'token': {'type': 'object', 'additionalProperties': False, 'required': ['symbol', 'address', 'decimals'], 'properties': {'symbol': {'type': 'string'}, 'address': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/address'}, 'decimals': {'type': 'integer', 'minimum': 0, 'maximum': 255}}}, 'variable_debt': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'stable_debt': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'total_debt_usd': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'variable_borrow_apy': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'stable_borrow_apy': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'reserve_utilization': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'borrow_cap': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)$'}, 'borrow_cap_used_percent': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}}}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['token', 'variable_debt', 'stable_debt', 'total_debt_usd', 'variable_borrow_apy', 'stable_borrow_apy', 'reserve_utilization', 'borrow_cap', 'borrow_cap_used_percent']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'additionalProperties': False, 'required': ['token', 'variable_debt', 'stable_debt', 'total_debt_usd', 'variable_borrow_apy', 'stable_borrow_apy', 'reserve_utilization', 'borrow_cap', 'borrow_cap_used_percent'], 'properties': {'token': {'type': 'object', 'additionalProperties': False, 'required': ['symbol', 'address', 'decimals'], 'properties': {'symbol': {'type': 'string'}, 'address': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/address'}, 'decimals': {'type': 'integer', 'minimum': 0, 'maximum': 255}}}, 'variable_debt': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'stable_debt': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'total_debt_usd': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'variable_borrow_apy': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'stable_borrow_apy': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'reserve_utilization': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'borrow_cap': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)$'}, 'borrow_cap_used_percent': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}}}, rule='required')
+        data_keys = set(data.keys())
+        if "token" in data_keys:
+            data_keys.remove("token")
+            data__token = data["token"]
+            validate_https___example_com_schemas_aave_hf_snapshot_schema_json___defs_token(data__token, custom_formats, (name_prefix or "data") + ".token")
+        if "variable_debt" in data_keys:
+            data_keys.remove("variable_debt")
+            data__variabledebt = data["variable_debt"]
+            validate_https___example_com_schemas_aave_hf_snapshot_schema_json___defs_udecimalstring(data__variabledebt, custom_formats, (name_prefix or "data") + ".variable_debt")
+        if "stable_debt" in data_keys:
+            data_keys.remove("stable_debt")
+            data__stabledebt = data["stable_debt"]
+            validate_https___example_com_schemas_aave_hf_snapshot_schema_json___defs_udecimalstring(data__stabledebt, custom_formats, (name_prefix or "data") + ".stable_debt")
+        if "total_debt_usd" in data_keys:
+            data_keys.remove("total_debt_usd")
+            data__totaldebtusd = data["total_debt_usd"]
+            validate_https___example_com_schemas_aave_hf_snapshot_schema_json___defs_udecimalstring(data__totaldebtusd, custom_formats, (name_prefix or "data") + ".total_debt_usd")
+        if "variable_borrow_apy" in data_keys:
+            data_keys.remove("variable_borrow_apy")
+            data__variableborrowapy = data["variable_borrow_apy"]
+            validate_https___example_com_schemas_aave_hf_snapshot_schema_json___defs_udecimalstring(data__variableborrowapy, custom_formats, (name_prefix or "data") + ".variable_borrow_apy")
+        if "stable_borrow_apy" in data_keys:
+            data_keys.remove("stable_borrow_apy")
+            data__stableborrowapy = data["stable_borrow_apy"]
+            validate_https___example_com_schemas_aave_hf_snapshot_schema_json___defs_udecimalstring(data__stableborrowapy, custom_formats, (name_prefix or "data") + ".stable_borrow_apy")
+        if "reserve_utilization" in data_keys:
+            data_keys.remove("reserve_utilization")
+            data__reserveutilization = data["reserve_utilization"]
+            validate_https___example_com_schemas_aave_hf_snapshot_schema_json___defs_udecimalstring(data__reserveutilization, custom_formats, (name_prefix or "data") + ".reserve_utilization")
+        if "borrow_cap" in data_keys:
+            data_keys.remove("borrow_cap")
+            data__borrowcap = data["borrow_cap"]
+            if not isinstance(data__borrowcap, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".borrow_cap must be string", value=data__borrowcap, name="" + (name_prefix or "data") + ".borrow_cap", definition={'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)$'}, rule='type')
+            if isinstance(data__borrowcap, str):
+                if not REGEX_PATTERNS['^(?:0|[1-9]\\d*)$'].search(data__borrowcap):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".borrow_cap must match pattern ^(?:0|[1-9]\\d*)$", value=data__borrowcap, name="" + (name_prefix or "data") + ".borrow_cap", definition={'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)$'}, rule='pattern')
+        if "borrow_cap_used_percent" in data_keys:
+            data_keys.remove("borrow_cap_used_percent")
+            data__borrowcapusedpercent = data["borrow_cap_used_percent"]
+            validate_https___example_com_schemas_aave_hf_snapshot_schema_json___defs_udecimalstring(data__borrowcapusedpercent, custom_formats, (name_prefix or "data") + ".borrow_cap_used_percent")
+        if data_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must not contain "+str(data_keys)+" properties", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'additionalProperties': False, 'required': ['token', 'variable_debt', 'stable_debt', 'total_debt_usd', 'variable_borrow_apy', 'stable_borrow_apy', 'reserve_utilization', 'borrow_cap', 'borrow_cap_used_percent'], 'properties': {'token': {'type': 'object', 'additionalProperties': False, 'required': ['symbol', 'address', 'decimals'], 'properties': {'symbol': {'type': 'string'}, 'address': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/address'}, 'decimals': {'type': 'integer', 'minimum': 0, 'maximum': 255}}}, 'variable_debt': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'stable_debt': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'total_debt_usd': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'variable_borrow_apy': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'stable_borrow_apy': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'reserve_utilization': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'borrow_cap': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)$'}, 'borrow_cap_used_percent': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}}}, rule='additionalProperties')
+    return data
+
+def validate_https___example_com_schemas_aave_hf_snapshot_schema_json___defs_collateralitem(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'additionalProperties': False, 'required': ['token', 'amount', 'amount_usd', 'price_usd', 'usage_as_collateral_enabled', 'reserve_ltv', 'reserve_liquidation_threshold', 'reserve_liquidation_bonus', 'emode_category'], 'properties': {'token': {'type': 'object', 'additionalProperties': False, 'required': ['symbol', 'address', 'decimals'], 'properties': {'symbol': {'type': 'string'}, 'address': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/address'}, 'decimals': {'type': 'integer', 'minimum': 0, 'maximum': 255}}}, 'amount': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'amount_usd': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'price_usd': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'usage_as_collateral_enabled': {'type': 'boolean'}, 'reserve_ltv': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'reserve_liquidation_threshold': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'reserve_liquidation_bonus': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'emode_category': {'type': ['string', 'null'], 'pattern': '^[0-9]+$'}}}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['token', 'amount', 'amount_usd', 'price_usd', 'usage_as_collateral_enabled', 'reserve_ltv', 'reserve_liquidation_threshold', 'reserve_liquidation_bonus', 'emode_category']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'additionalProperties': False, 'required': ['token', 'amount', 'amount_usd', 'price_usd', 'usage_as_collateral_enabled', 'reserve_ltv', 'reserve_liquidation_threshold', 'reserve_liquidation_bonus', 'emode_category'], 'properties': {'token': {'type': 'object', 'additionalProperties': False, 'required': ['symbol', 'address', 'decimals'], 'properties': {'symbol': {'type': 'string'}, 'address': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/address'}, 'decimals': {'type': 'integer', 'minimum': 0, 'maximum': 255}}}, 'amount': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'amount_usd': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'price_usd': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'usage_as_collateral_enabled': {'type': 'boolean'}, 'reserve_ltv': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'reserve_liquidation_threshold': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'reserve_liquidation_bonus': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'emode_category': {'type': ['string', 'null'], 'pattern': '^[0-9]+$'}}}, rule='required')
+        data_keys = set(data.keys())
+        if "token" in data_keys:
+            data_keys.remove("token")
+            data__token = data["token"]
+            validate_https___example_com_schemas_aave_hf_snapshot_schema_json___defs_token(data__token, custom_formats, (name_prefix or "data") + ".token")
+        if "amount" in data_keys:
+            data_keys.remove("amount")
+            data__amount = data["amount"]
+            validate_https___example_com_schemas_aave_hf_snapshot_schema_json___defs_udecimalstring(data__amount, custom_formats, (name_prefix or "data") + ".amount")
+        if "amount_usd" in data_keys:
+            data_keys.remove("amount_usd")
+            data__amountusd = data["amount_usd"]
+            validate_https___example_com_schemas_aave_hf_snapshot_schema_json___defs_udecimalstring(data__amountusd, custom_formats, (name_prefix or "data") + ".amount_usd")
+        if "price_usd" in data_keys:
+            data_keys.remove("price_usd")
+            data__priceusd = data["price_usd"]
+            validate_https___example_com_schemas_aave_hf_snapshot_schema_json___defs_udecimalstring(data__priceusd, custom_formats, (name_prefix or "data") + ".price_usd")
+        if "usage_as_collateral_enabled" in data_keys:
+            data_keys.remove("usage_as_collateral_enabled")
+            data__usageascollateralenabled = data["usage_as_collateral_enabled"]
+            if not isinstance(data__usageascollateralenabled, (bool)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".usage_as_collateral_enabled must be boolean", value=data__usageascollateralenabled, name="" + (name_prefix or "data") + ".usage_as_collateral_enabled", definition={'type': 'boolean'}, rule='type')
+        if "reserve_ltv" in data_keys:
+            data_keys.remove("reserve_ltv")
+            data__reserveltv = data["reserve_ltv"]
+            validate_https___example_com_schemas_aave_hf_snapshot_schema_json___defs_udecimalstring(data__reserveltv, custom_formats, (name_prefix or "data") + ".reserve_ltv")
+        if "reserve_liquidation_threshold" in data_keys:
+            data_keys.remove("reserve_liquidation_threshold")
+            data__reserveliquidationthreshold = data["reserve_liquidation_threshold"]
+            validate_https___example_com_schemas_aave_hf_snapshot_schema_json___defs_udecimalstring(data__reserveliquidationthreshold, custom_formats, (name_prefix or "data") + ".reserve_liquidation_threshold")
+        if "reserve_liquidation_bonus" in data_keys:
+            data_keys.remove("reserve_liquidation_bonus")
+            data__reserveliquidationbonus = data["reserve_liquidation_bonus"]
+            validate_https___example_com_schemas_aave_hf_snapshot_schema_json___defs_udecimalstring(data__reserveliquidationbonus, custom_formats, (name_prefix or "data") + ".reserve_liquidation_bonus")
+        if "emode_category" in data_keys:
+            data_keys.remove("emode_category")
+            data__emodecategory = data["emode_category"]
+            if not isinstance(data__emodecategory, (str, NoneType)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".emode_category must be string or null", value=data__emodecategory, name="" + (name_prefix or "data") + ".emode_category", definition={'type': ['string', 'null'], 'pattern': '^[0-9]+$'}, rule='type')
+            if isinstance(data__emodecategory, str):
+                if not REGEX_PATTERNS['^[0-9]+$'].search(data__emodecategory):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".emode_category must match pattern ^[0-9]+$", value=data__emodecategory, name="" + (name_prefix or "data") + ".emode_category", definition={'type': ['string', 'null'], 'pattern': '^[0-9]+$'}, rule='pattern')
+        if data_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must not contain "+str(data_keys)+" properties", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'additionalProperties': False, 'required': ['token', 'amount', 'amount_usd', 'price_usd', 'usage_as_collateral_enabled', 'reserve_ltv', 'reserve_liquidation_threshold', 'reserve_liquidation_bonus', 'emode_category'], 'properties': {'token': {'type': 'object', 'additionalProperties': False, 'required': ['symbol', 'address', 'decimals'], 'properties': {'symbol': {'type': 'string'}, 'address': {'$ref': 'https://example.com/schemas/aave-hf-snapshot.schema.json#/$defs/address'}, 'decimals': {'type': 'integer', 'minimum': 0, 'maximum': 255}}}, 'amount': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'amount_usd': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'price_usd': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'usage_as_collateral_enabled': {'type': 'boolean'}, 'reserve_ltv': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'reserve_liquidation_threshold': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'reserve_liquidation_bonus': {'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, 'emode_category': {'type': ['string', 'null'], 'pattern': '^[0-9]+$'}}}, rule='additionalProperties')
+    return data
+
+def validate_https___example_com_schemas_aave_hf_snapshot_schema_json___defs_udecimalstring(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (str)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be string", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, rule='type')
+    if isinstance(data, str):
+        if not REGEX_PATTERNS['^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'].search(data):
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must match pattern ^(?:0|[1-9]\\d*)(?:\\.\\d+)?$", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'string', 'pattern': '^(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, rule='pattern')
+    return data
+
+def validate_https___example_com_schemas_aave_hf_snapshot_schema_json___defs_decimalstring(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (str)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be string", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'string', 'pattern': '^-?(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, rule='type')
+    if isinstance(data, str):
+        if not REGEX_PATTERNS['^-?(?:0|[1-9]\\d*)(?:\\.\\d+)?$'].search(data):
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must match pattern ^-?(?:0|[1-9]\\d*)(?:\\.\\d+)?$", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'string', 'pattern': '^-?(?:0|[1-9]\\d*)(?:\\.\\d+)?$'}, rule='pattern')
+    return data
+
+def validate_https___example_com_schemas_aave_hf_snapshot_schema_json___defs_address(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (str)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be string", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'string', 'pattern': '^0x[0-9a-fA-F]{40}$'}, rule='type')
+    if isinstance(data, str):
+        if not REGEX_PATTERNS['^0x[0-9a-fA-F]{40}$'].search(data):
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must match pattern ^0x[0-9a-fA-F]{40}$", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'string', 'pattern': '^0x[0-9a-fA-F]{40}$'}, rule='pattern')
+    return data
+
+validate = validate_https___example_com_schemas_aave_hf_snapshot_schema_json
@@ -0,0 +1,40 @@
+# scripts/gen_validator.py
+"""
+Regenerate schemas/_aave_hf_validator.py from the snapshot schema with fastjsonschema.
+
+    python scripts/gen_validator.py [path/to/schema.json]
+
+Run it after every schema change. validate_schema.py ignores the generated module
+once its SCHEMA_FINGERPRINT no longer matches the schema file it loads.
+"""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from validate_schema import (  # noqa: E402
+    GENERATED_VALIDATOR, SCHEMA_PATH, fastjsonschema, generate_validator_code, load_schema,
+)
+
+
+def main() -> None:
+    if fastjsonschema is None:
+        raise SystemExit("fastjsonschema is required: pip install fastjsonschema")
+    schema_path = Path(sys.argv[1]).resolve() if len(sys.argv) > 1 else ROOT / SCHEMA_PATH
+    schema, digest = load_schema(schema_path)
+    code = generate_validator_code(schema)
+
+    out_path = ROOT / GENERATED_VALIDATOR
+    header = (
+        f"# Generated by scripts/gen_validator.py from {schema_path.name}; do not edit.\n"
+        f'SCHEMA_FINGERPRINT = "{digest}"\n'
+    )
+    out_path.write_text(header + code, encoding="utf-8")
+    print(f"Wrote {out_path.relative_to(ROOT)} ({digest})")
+
+
+if __name__ == "__main__":
+    main()
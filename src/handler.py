@@ -2,69 +2,67 @@
 import os
 import json
 import time
+import asyncio
 import argparse
-from decimal import Decimal, getcontext
-from typing import Any, Dict, List, Tuple
-from web3 import Web3
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+import aiohttp
+from web3 import AsyncHTTPProvider, AsyncWeb3, Web3
+from eth_abi import decode as abi_decode, encode as abi_encode
 from dotenv import load_dotenv
 
 # =========================
-# Precision configuration
+# Fixed-point configuration
 # =========================
-getcontext().prec = 120  # high precision for intermediate math
+# On-chain values are integers with an implied decimal scale; all math stays in Python ints
+# and is only rendered as a decimal string at output time.
+WAD_DECIMALS = 18   # health factor
+RAY_DECIMALS = 27   # rates, and the precision used for derived ratios
+BPS_DECIMALS = 4    # ltv / liquidation threshold / bonus
 
-def D(x) -> Decimal:
-    return x if isinstance(x, Decimal) else Decimal(str(x))
+# Powers of ten up to uint256 width, computed once; scales beyond the table fall back to 10 ** n.
+_POW10_INT: List[int] = [10 ** i for i in range(79)]
+_BPS = _POW10_INT[BPS_DECIMALS]
 
-def to_units(raw: int, decimals: int) -> Decimal:
-    if decimals <= 0:
-        return D(raw)
-    return D(raw) / (Decimal(10) ** decimals)
+def _pow10(n: int) -> int:
+    return _POW10_INT[n] if n < 79 else 10 ** n
 
-# --- strict formatters for schema contract ---
-def _fmt_plain_decimal(x: Decimal) -> str:
-    """Return a plain decimal string (no scientific notation), trim '-0' to '0'."""
-    s = format(x, "f")
-    if s.startswith("-0"):
-        try:
-            if Decimal(s) == 0:
-                return "0"
-        except Exception:
-            pass
-    return s
+def rescale(raw: int, from_scale: int, to_scale: int) -> int:
+    """Move a fixed-point integer between decimal scales (floors when narrowing)."""
+    if to_scale >= from_scale:
+        return raw * _pow10(to_scale - from_scale)
+    return raw // _pow10(from_scale - to_scale)
 
-def as_str(dec: Decimal) -> str:
-    """
-    String decimals for money/ratios/apys/etc.
-    """
-    return _fmt_plain_decimal(dec)
+def _ratio(num: int, den: int, scale: int = RAY_DECIMALS) -> int:
+    """num / den as a fixed-point integer at `scale` decimals (floored)."""
+    return (num * _pow10(scale)) // den
 
-def as_str_udecimal(x) -> str:
+# --- strict formatters for schema contract ---
+def fmt_fixed(raw: int, scale: int) -> str:
     """
-    Unsigned decimal for non-negative quantities; clamps '-0' to '0'.
+    Render a fixed-point integer (raw / 10**scale) as a plain decimal string.
+    Trailing fractional zeros are trimmed; zero renders as '0'.
     """
-    s = _fmt_plain_decimal(D(x))
-    return "0" if s in ("-0", "-0.0") else s
-
-def as_str_uint(x) -> str:
+    if raw == 0:
+        return "0"
+    sign = "-" if raw < 0 else ""
+    int_part, frac = divmod(abs(raw), _pow10(scale))
+    if frac == 0:
+        return f"{sign}{int_part}"
+    # frac is non-zero, so stripping zeros from the right never reaches the '.'
+    return f"{sign}{int_part}.{frac:0{scale}d}".rstrip("0")
+
+def as_str_uint(x: int) -> str:
     """
     String integer for large on-chain counters/caps/supplies (can exceed JS safe range).
-    Floors toward zero and rejects negatives.
+    Rejects negatives.
     """
-    if isinstance(x, int):
-        if x < 0:
-            raise ValueError("uint cannot be negative")
-        return str(x)
-    d = D(x)
-    if d < 0:
+    if x < 0:
         raise ValueError("uint cannot be negative")
-    return str(int(d))
-
-def safe(fn, default=None):
-    try:
-        return fn()
-    except Exception:
-        return default
+    return str(x)
 
 # =========================
 # Minimal ABIs
@@ -117,393 +115,601 @@ IPriceOracle_ABI = [
      "stateMutability": "view", "type": "function"},
 ]
 
-IChainlinkAggregator_ABI = [
-    {"name": "latestRoundData", "inputs": [], "outputs": [
-        {"name": "roundId", "type": "uint80"},
-        {"name": "answer", "type": "int256"},
-        {"name": "startedAt", "type": "uint256"},
-        {"name": "updatedAt", "type": "uint256"},
-        {"name": "answeredInRound", "type": "uint80"}],
-     "stateMutability": "view", "type": "function"}
-]
-
-IPoolConfigurator_ABI = [
-    {"name": "getReserveCaps", "inputs": [{"name": "asset", "type": "address"}], "outputs": [
-        {"name": "borrowCap", "type": "uint256"},
-        {"name": "supplyCap", "type": "uint256"}],
-     "stateMutability": "view", "type": "function"}
-]
-
-ERC20_ABI = [
-    {"name": "symbol", "inputs": [], "outputs": [{"type": "string"}],
-     "stateMutability": "view", "type": "function"},
-    {"name": "decimals", "inputs": [], "outputs": [{"type": "uint8"}],
-     "stateMutability": "view", "type": "function"},
-    {"name": "balanceOf", "inputs": [{"name": "owner", "type": "address"}],
-     "outputs": [{"type": "uint256"}], "stateMutability": "view", "type": "function"},
-    {"name": "totalSupply", "inputs": [], "outputs": [{"type": "uint256"}],
-     "stateMutability": "view", "type": "function"},
-]
-
-MULTICALL3_ABI = [
-    {"inputs": [{"internalType": "bool", "name": "requireSuccess", "type": "bool"},
-                {"components": [{"internalType": "address", "name": "target", "type": "address"},
-                                {"internalType": "bytes", "name": "callData", "type": "bytes"}],
-                 "internalType": "struct Multicall3.Call[]", "name": "calls", "type": "tuple[]"}],
-     "name": "tryAggregate",
-     "outputs": [{"components": [{"internalType": "bool", "name": "success", "type": "bool"},
-                                 {"internalType": "bytes", "name": "returnData", "type": "bytes"}],
-                  "internalType": "struct Multicall3.Result[]", "name": "returnData", "type": "tuple[]"}],
-     "stateMutability": "payable", "type": "function"},
-]
-
 # =========================
 # Constants (Base / Aave v3)
 # =========================
+CHAIN_ID = 8453
 POOL_ADDRESS = Web3.to_checksum_address("0xA238Dd80C259a72e81d7e4664a9801593F98d1c5")
 MULTICALL3_ADDRESS = Web3.to_checksum_address("0xcA11bde05977b3631167028862bE2a173976CA11")
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+# Inner calls per tryAggregate; larger batches are split and sent concurrently so no single
+# eth_call runs into provider gas/time limits.
+MULTICALL_CHUNK_SIZE = 50
 
 # =========================
-# Helpers
+# Warm-process caches
 # =========================
-def _encode(fn) -> bytes:
-    return Web3.to_bytes(hexstr=fn._encode_transaction_data())
-
-def run_multicall(w3, multicall, calls: List[Tuple[str, bytes]]) -> List[Tuple[bool, bytes]]:
-    call_structs = [{"target": target, "callData": data} for target, data in calls]
-    results = multicall.functions.tryAggregate(False, call_structs).call()
-    return [(res[0], res[1]) for res in results]
-
-def conf_bits(x: int, start: int, length: int) -> int:
-    mask = (1 << length) - 1
-    return (x >> start) & mask
-
-def decode_config(conf_uint: int) -> Dict[str, Any]:
-    ltv_bps = conf_bits(conf_uint, 0, 16)
-    liq_thr_bps = conf_bits(conf_uint, 16, 16)
-    liq_bonus_bps = conf_bits(conf_uint, 32, 16)
-    decimals_bits = conf_bits(conf_uint, 48, 8)
-    emode_cat = conf_bits(conf_uint, 184, 8)
-    return {
-        "ltv_bps": ltv_bps,
-        "liq_thr_bps": liq_thr_bps,
-        "liq_bonus_bps": liq_bonus_bps,
-        "decimals_bits": decimals_bits,
-        "emode_category": int(emode_cat) if emode_cat > 0 else None,
-        "usage_as_collateral_enabled": bool(ltv_bps > 0),
-    }
+# One event loop for the sync wrapper on the main thread, with one keep-alive HTTP session per RPC URL
+# on it for the life of a warm process; web3's default async session sets force_close, which
+# re-handshakes TLS on every request. Snapshots on any other loop or thread use a one-shot session.
+_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_PROVIDERS: Dict[str, Any] = {}
+
+# Pool wiring (addresses provider, oracle, configurator, base unit) never changes for a given pool.
+_POOL_CONTEXT: Dict[str, Dict[str, Any]] = {}
+
+# Persisted caches default to the system temp dir (/tmp on Linux, %TEMP% on Windows).
+_CACHE_DIR = tempfile.gettempdir()
+
+# Per-reserve token/feed addresses, keyed by "<chain_id>:<reserve>" and persisted across invocations
+# so the balance calls can ride in the same multicall as the reserve data.
+RESERVE_ADDR_CACHE_PATH = os.environ.get("RESERVE_ADDR_CACHE_PATH", os.path.join(_CACHE_DIR, "reserve_addrs.json"))
+_RESERVE_ADDR_CACHE: Dict[str, Dict[str, str]] = {}
+
+# ERC20 symbol/decimals are immutable: "<chain_id>:<token>" -> [symbol, decimals], persisted likewise.
+TOKEN_META_CACHE_PATH = os.environ.get("TOKEN_META_CACHE_PATH", os.path.join(_CACHE_DIR, "token_meta.json"))
+_TOKEN_META: Dict[str, List[Any]] = {}
+
+_LOADED_CACHES: set = set()
+
+# Supply/borrow caps only move through governance; reuse a read for a short TTL (process-local).
+CAPS_CACHE_TTL_S = 60
+_CAPS_CACHE: Dict[str, Tuple[float, int, int]] = {}  # asset -> (expiry_ts, borrow_cap, supply_cap)
 
 # =========================
-# Core engine (pure function)
+# Helpers
 # =========================
-def build_snapshot(rpc_url: str, user_address: str) -> Dict[str, Any]:
-    t0 = time.perf_counter()
+def _selector(signature: str) -> bytes:
+    return bytes(Web3.keccak(text=signature)[:4])
+
+# Values that turn a boolean env flag on, case-insensitively; validate_schema.py accepts the same set
+TRUTHY_ENV_VALUES = ("1", "true", "yes")
+
+def _env_flag(name: str) -> bool:
+    return os.environ.get(name, "").strip().lower() in TRUTHY_ENV_VALUES
+
+# 4-byte selectors for the hot-path calls; calldata is selector + abi_encode(args)
+SEL_getReserveData = _selector("getReserveData(address)")
+SEL_getAssetPrice = _selector("getAssetPrice(address)")
+SEL_getReserveCaps = _selector("getReserveCaps(address)")
+SEL_getSourceOfAsset = _selector("getSourceOfAsset(address)")
+SEL_symbol = _selector("symbol()")
+SEL_decimals = _selector("decimals()")
+SEL_balanceOf = _selector("balanceOf(address)")
+SEL_totalSupply = _selector("totalSupply()")
+SEL_latestRoundData = _selector("latestRoundData()")
+SEL_tryAggregate = _selector("tryAggregate(bool,(address,bytes)[])")
+
+# Risk-class thresholds on the WAD health factor (1.05 / 1.25)
+HF_HIGH_RISK_WAD = 105 * 10 ** 16
+HF_MODERATE_RISK_WAD = 125 * 10 ** 16
+
+# Type tuples for abi_encode / abi_decode, built once instead of per reserve
+_RD_TYPES = ('uint256', 'uint128', 'uint128', 'uint128', 'uint128', 'uint128', 'uint40', 'uint16',
+             'address', 'address', 'address', 'address', 'uint128', 'uint128', 'uint128')
+_FEED_TYPES = ('uint80', 'int256', 'uint256', 'uint256', 'uint80')
+_UINT256_TYPES = ('uint256',)
+_CAPS_TYPES = ('uint256', 'uint256')
+_ADDRESS_TYPES = ('address',)
+_STRING_TYPES = ('string',)
+_UINT8_TYPES = ('uint8',)
+_TRY_AGGREGATE_ARG_TYPES = ('bool', '(address,bytes)[]')
+_TRY_AGGREGATE_RET_TYPES = ('(bool,bytes)[]',)
+
+async def run_multicall(w3, calls: List[Tuple[str, bytes]]) -> List[Tuple[bool, bytes]]:
+    """
+    Multicall3.tryAggregate(false, calls) as a raw eth_call; calldata is encoded straight from the
+    (target, data) tuples instead of going through the contract-function wrapper.
+    """
+    payload = SEL_tryAggregate + abi_encode(_TRY_AGGREGATE_ARG_TYPES, [False, calls])
+    raw = await w3.eth.call({"to": MULTICALL3_ADDRESS, "data": payload})
+    return list(abi_decode(_TRY_AGGREGATE_RET_TYPES, raw)[0])
 
-    w3 = Web3(Web3.HTTPProvider(rpc_url, request_kwargs={"timeout": 20}))
-    if not w3.is_connected():
-        raise RuntimeError(f"Cannot connect to Base RPC at {rpc_url}")
+async def run_multicall_chunked(w3, calls: List[Tuple[str, bytes]],
+                                chunk: int = MULTICALL_CHUNK_SIZE) -> List[Tuple[bool, bytes]]:
+    """
+    run_multicall over `chunk`-sized slices issued in parallel; results keep the input order.
+    """
+    if len(calls) <= chunk:
+        return await run_multicall(w3, calls)
+    parts = await asyncio.gather(*[
+        run_multicall(w3, calls[i: i + chunk]) for i in range(0, len(calls), chunk)
+    ])
+    return [res for part in parts for res in part]
+
+def _load_json_cache(path: str, cache: Dict[str, Any]) -> Dict[str, Any]:
+    """Fill `cache` from its JSON file once per process; a missing or unreadable file starts empty."""
+    if path not in _LOADED_CACHES:
+        _LOADED_CACHES.add(path)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                cache.update(data)
+        except (OSError, ValueError):
+            pass
+    return cache
 
-    # --- Contracts ---
-    pool = w3.eth.contract(address=POOL_ADDRESS, abi=IPool_ABI)
-    multicall = w3.eth.contract(address=MULTICALL3_ADDRESS, abi=MULTICALL3_ABI)
+def _save_json_cache(path: str, cache: Dict[str, Any]) -> None:
+    try:
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+@lru_cache(maxsize=4096)
+def _checksum(addr: str) -> str:
+    """EIP-55 form for display; addresses are carried lowercase internally."""
+    return Web3.to_checksum_address(addr)
+
+def _cache_key(addr: str) -> str:
+    return f"{CHAIN_ID}:{addr}"
+
+async def rpc_batch(w3, fns: List[Any]) -> List[Any]:
+    """
+    Send contract-function calls as one JSON-RPC batch (a single HTTP POST); results come back in order.
+    """
+    async with w3.batch_requests() as batch:
+        for fn in fns:
+            batch.add(fn)
+        return list(await batch.async_execute())
 
-    provider_addr = pool.functions.ADDRESSES_PROVIDER().call()
+async def _bootstrap_addresses(w3, pool) -> Dict[str, Any]:
+    """
+    Addresses provider / oracle / configurator / base unit for POOL_ADDRESS, resolved once per process.
+    Each step needs the previous address, so the cold path is three round-trips with the
+    oracle/configurator lookups sharing one batch.
+    """
+    ctx = _POOL_CONTEXT.get(pool.address)
+    if ctx is not None:
+        return ctx
+
+    provider_addr = await pool.functions.ADDRESSES_PROVIDER().call()
     provider = w3.eth.contract(address=provider_addr, abi=IAddressesProvider_ABI)
+    oracle_addr, configurator_addr = await rpc_batch(w3, [
+        provider.functions.getPriceOracle(),
+        provider.functions.getPoolConfigurator(),
+    ])
 
-    oracle_addr = provider.functions.getPriceOracle().call()
     oracle = w3.eth.contract(address=oracle_addr, abi=IPriceOracle_ABI)
+    try:
+        base_unit = await oracle.functions.BASE_CURRENCY_UNIT().call()
+    except Exception:
+        base_unit = None
 
-    configurator_addr = provider.functions.getPoolConfigurator().call()
-    configurator = w3.eth.contract(address=configurator_addr, abi=IPoolConfigurator_ABI)
+    ctx = {
+        "oracle": oracle_addr,
+        "configurator": configurator_addr,
+        "base_unit": base_unit or 10**8,
+    }
+    # a failed BASE_CURRENCY_UNIT read falls back to 1e8 for this call only
+    if base_unit:
+        _POOL_CONTEXT[pool.address] = ctx
+    return ctx
+
+def _emit(calls: List[Tuple[str, bytes]], slots: Dict[str, Optional[int]], name: str,
+          target: str, data: bytes) -> None:
+    slots[name] = len(calls)
+    calls.append((target, data))
 
-    base_unit = safe(lambda: oracle.functions.BASE_CURRENCY_UNIT().call(), 10**8) or 10**8
-    base_unit_d = D(base_unit)
+# Symbols treated as the base-currency (ETH) reserve, in lookup order
+WETH_SYMBOLS = ("WETH", "WETH.E", "WETH9")
 
-    reserves: List[str] = [Web3.to_checksum_address(a) for a in pool.functions.getReservesList().call()]
+RESERVE_SLOTS = ("rd", "px", "cap", "src", "sym", "dec")
+BALANCE_SLOTS = ("a_bal", "a_sup", "s_bal", "s_sup", "v_bal", "v_sup", "feed")
+
+def _append_balance_calls(calls: List[Tuple[str, bytes]], user_address: Optional[str], aToken: str, sDebt: str,
+                          vDebt: str, price_feed_addr: str) -> Dict[str, Optional[int]]:
+    """
+    Append the per-reserve user calls (aToken/sDebt/vDebt balanceOf + totalSupply, feed latestRoundData)
+    to `calls` and return a slot map of their indices. Zero addresses emit nothing and map to None;
+    user_address=None skips the balanceOf calls.
+    """
+    balance_data = SEL_balanceOf + abi_encode(_ADDRESS_TYPES, [user_address]) if user_address else None
+    slots: Dict[str, Optional[int]] = dict.fromkeys(BALANCE_SLOTS)
+    for prefix, token in (("a", aToken), ("s", sDebt), ("v", vDebt)):
+        if int(token, 16) != 0:
+            if balance_data is not None:
+                _emit(calls, slots, prefix + "_bal", token, balance_data)
+            _emit(calls, slots, prefix + "_sup", token, SEL_totalSupply)
+
+    if int(price_feed_addr, 16) != 0:
+        _emit(calls, slots, "feed", price_feed_addr, SEL_latestRoundData)
+    return slots
+
+def _pick_slots(results: List[Tuple[bool, bytes]],
+                slots: Dict[str, Optional[int]]) -> Dict[str, Optional[Tuple[bool, bytes]]]:
+    return {name: (None if idx is None else results[idx]) for name, idx in slots.items()}
+
+def _uint_result(res: Optional[Tuple[bool, bytes]]) -> int:
+    """A single-word uint result; 0 for skipped, failed or empty calls."""
+    if res is None or not res[0] or not res[1]:
+        return 0
+    return int.from_bytes(res[1], 'big')
+
+class CfgBits(NamedTuple):
+    ltv_bps: int
+    liq_thr_bps: int
+    liq_bonus_bps: int
+    decimals_bits: int
+    emode_category: int  # 0 = none
+
+def decode_config(x: int) -> CfgBits:
+    """ReserveConfigurationMap fields: bits 0-15, 16-31, 32-47, 48-55 and 184-191."""
+    return CfgBits(x & 0xFFFF, (x >> 16) & 0xFFFF, (x >> 32) & 0xFFFF, (x >> 48) & 0xFF, (x >> 184) & 0xFF)
+
+# =========================
+# Core engine (pure function)
+# =========================
+def _event_loop() -> asyncio.AbstractEventLoop:
+    global _LOOP
+    if _LOOP is None or _LOOP.is_closed():
+        _LOOP = asyncio.new_event_loop()
+        _PROVIDERS.clear()  # sessions bound to the old loop cannot be reused
+    return _LOOP
+
+def _new_session() -> aiohttp.ClientSession:
+    return aiohttp.ClientSession(
+        raise_for_status=True,
+        connector=aiohttp.TCPConnector(limit=8, keepalive_timeout=60),
+    )
+
+async def _make_w3(rpc_url: str, session: aiohttp.ClientSession):
+    provider = AsyncHTTPProvider(rpc_url, request_kwargs={"timeout": 20})
+    await provider.cache_async_session(session)
+    w3 = AsyncWeb3(provider)
+    # the validation middleware sends eth_chainId ahead of every eth_call and batch only to check a
+    # tx chainId, which these read-only calls never carry
+    w3.middleware_onion.remove("validation")
+    return w3
+
+async def _get_w3(rpc_url: str):
+    """
+    AsyncWeb3 bound to the pooled keep-alive session, reused across invocations on _LOOP.
+    """
+    w3 = _PROVIDERS.get(rpc_url)
+    if w3 is None:
+        w3 = _PROVIDERS[rpc_url] = await _make_w3(rpc_url, _new_session())
+    return w3
+
+def build_snapshot(rpc_url: str, user_address: str) -> Dict[str, Any]:
+    """Synchronous wrapper around build_snapshot_async for the handler and CLI."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        if threading.current_thread() is threading.main_thread():
+            return _event_loop().run_until_complete(build_snapshot_async(rpc_url, user_address))
+        # worker threads may run concurrently and exit without cleanup, so they never touch _LOOP
+        return asyncio.run(build_snapshot_async(rpc_url, user_address))
+    # called from code already running a loop: block on a worker thread, as the sync API promises
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, build_snapshot_async(rpc_url, user_address)).result()
+
+async def build_snapshot_async(rpc_url: str, user_address: str) -> Dict[str, Any]:
+    if asyncio.get_running_loop() is _LOOP:
+        return await _build_snapshot(await _get_w3(rpc_url), user_address)
+    # a caller-owned loop may close at any time, so its session lives only for this snapshot
+    async with _new_session() as session:
+        return await _build_snapshot(await _make_w3(rpc_url, session), user_address)
+
+async def _build_snapshot(w3, user_address: str) -> Dict[str, Any]:
+    t0 = time.perf_counter()
+    user_address = _checksum(user_address)
+
+    # --- Contracts ---
+    pool = w3.eth.contract(address=POOL_ADDRESS, abi=IPool_ABI)
+
+    ctx = await _bootstrap_addresses(w3, pool)
+    oracle_addr = ctx["oracle"]
+    configurator_addr = ctx["configurator"]
+
+    base_unit = ctx["base_unit"]
+    base_decimals = len(str(base_unit)) - 1  # BASE_CURRENCY_UNIT is a power of ten (1e8 for USD)
+
+    # account data does not depend on any reserve call, so it shares a batch with the reserves list
+    reserves_raw, u = await rpc_batch(w3, [
+        pool.functions.getReservesList(),
+        pool.functions.getUserAccountData(user_address),
+    ])
+    # lowercase throughout to match abi_decode output; only output rows are checksummed
+    reserves: List[str] = [a.lower() for a in reserves_raw]
+    # SKIP_EMPTY_USER=1/true/yes: a wallet with no collateral and no debt skips its balanceOf calls and gets
+    # empty collateral/debt sections; reserve-level oracle and caps data is still reported.
+    empty_user = _env_flag("SKIP_EMPTY_USER") and int(u[0]) == 0 and int(u[1]) == 0
+    balance_user = None if empty_user else user_address
+    addr_cache = _load_json_cache(RESERVE_ADDR_CACHE_PATH, _RESERVE_ADDR_CACHE)
+    token_meta = _load_json_cache(TOKEN_META_CACHE_PATH, _TOKEN_META)
 
     # --- symbol/decimals caches ---
     symbols: Dict[str, str] = {}
     decimals: Dict[str, int] = {}
 
-    # -------- Batch 1 --------
-    batch1_calls = []
+    # -------- Batch 1 (+ Batch 2 for reserves with cached token/feed addresses) --------
+    # Always: getReserveData, price, getSourceOfAsset; caps unless read within CAPS_CACHE_TTL_S.
+    # Address-cache misses defer their balance calls to a follow-up multicall; hits append the
+    # balance/feed calls right here. Token-meta misses add symbol/decimals.
+    calls: List[Tuple[str, bytes]] = []
+    # (asset, cached addresses or {}, cached [symbol, decimals] or None, cached caps or None,
+    #  reserve slots, balance slots)
+    plan: List[Tuple[str, Dict[str, str], Any, Any, Dict[str, Optional[int]], Dict[str, Optional[int]]]] = []
+    now = time.time()
     for asset in reserves:
-        batch1_calls.append((pool.address, _encode(pool.functions.getReserveData(asset))))
-        batch1_calls.append((oracle.address, _encode(oracle.functions.getAssetPrice(asset))))
-        batch1_calls.append((configurator.address, _encode(configurator.functions.getReserveCaps(asset))))
-        batch1_calls.append((oracle.address, _encode(oracle.functions.getSourceOfAsset(asset))))
-        erc = w3.eth.contract(address=Web3.to_checksum_address(asset), abi=ERC20_ABI)
-        batch1_calls.append((asset, _encode(erc.functions.symbol())))
-        batch1_calls.append((asset, _encode(erc.functions.decimals())))
-
-    results_b1 = run_multicall(w3, multicall, batch1_calls)
-
-    asset_data: Dict[str, Any] = {}
+        cached = addr_cache.get(_cache_key(asset)) or {}
+        meta = token_meta.get(_cache_key(asset))
+        caps = _CAPS_CACHE.get(asset)
+        if caps is not None and caps[0] <= now:
+            caps = None
+        asset_arg = abi_encode(_ADDRESS_TYPES, [asset])
+        rslots: Dict[str, Optional[int]] = dict.fromkeys(RESERVE_SLOTS)
+        _emit(calls, rslots, "rd", pool.address, SEL_getReserveData + asset_arg)
+        _emit(calls, rslots, "px", oracle_addr, SEL_getAssetPrice + asset_arg)
+        if caps is None:
+            _emit(calls, rslots, "cap", configurator_addr, SEL_getReserveCaps + asset_arg)
+        # the oracle source is re-read every time: governance can swap it under the cached feed
+        _emit(calls, rslots, "src", oracle_addr, SEL_getSourceOfAsset + asset_arg)
+        if meta is None:
+            _emit(calls, rslots, "sym", asset, SEL_symbol)
+            _emit(calls, rslots, "dec", asset, SEL_decimals)
+        bslots: Dict[str, Optional[int]] = {}
+        if cached:
+            bslots = _append_balance_calls(calls, balance_user, cached["aToken"], cached["sDebt"],
+                                           cached["vDebt"], cached["price_feed"])
+        plan.append((asset, cached, meta, caps, rslots, bslots))
+
+    results = await run_multicall_chunked(w3, calls)
+
+    # Decoded reserve data as parallel lists indexed by position in valid_reserves
+    valid_reserves: List[str] = []
+    cfg_list: List[CfgBits] = []
+    decs_list: List[int] = []
+    var_rate_list: List[int] = []     # ray
+    st_rate_list: List[int] = []      # ray
+    px_list: List[int] = []           # base currency units
+    borrow_cap_list: List[int] = []
+    supply_cap_list: List[int] = []
+    balance_list: List[Optional[Dict[str, Optional[Tuple[bool, bytes]]]]] = []
     batch2_calls: List[Tuple[str, bytes]] = []
-    call_idx = 0
-    for asset in reserves:
-        res_rd, res_px, res_cap, res_src, res_sym, res_dec = results_b1[call_idx: call_idx + 6]
+    batch2_slots: List[Tuple[int, Dict[str, Optional[int]]]] = []
+    addr_cache_dirty = False
+    token_meta_dirty = False
+    for asset, cached, meta, caps, rslots, bslots in plan:
+        picked = _pick_slots(results, rslots)
+        res_rd, res_px, res_cap = picked["rd"], picked["px"], picked["cap"]
 
         if not res_rd[0]:
-            call_idx += 6
             continue
 
-        output_types = ['uint256', 'uint128', 'uint128', 'uint128', 'uint128', 'uint128', 'uint40', 'uint16',
-                        'address', 'address', 'address', 'address', 'uint128', 'uint128', 'uint128']
-        rd = w3.codec.decode(output_types, res_rd[1])
-        conf_uint, var_rate, st_rate = int(rd[0]), D(rd[4]), D(rd[5])
-
-        aToken = Web3.to_checksum_address(rd[8])
-        sDebt = Web3.to_checksum_address(rd[9])
-        vDebt = Web3.to_checksum_address(rd[10])
-
-        px_raw = w3.codec.decode(['uint256'], res_px[1])[0] if res_px[0] else 0
-        borrow_cap, supply_cap = w3.codec.decode(['uint256', 'uint256'], res_cap[1]) if res_cap[0] else (0, 0)
-        raw_price_feed = w3.codec.decode(['address'], res_src[1])[0] if res_src[0] else "0x0000000000000000000000000000000000000000"
-        price_feed_addr = Web3.to_checksum_address(raw_price_feed)
+        rd = abi_decode(_RD_TYPES, res_rd[1])
+        conf_uint, var_rate, st_rate = int(rd[0]), int(rd[4]), int(rd[5])
 
-        try:
-            symbols[asset] = w3.codec.decode(['string'], res_sym[1])[0]
-        except Exception:
-            symbols[asset] = "UNKNOWN"
-        try:
-            decimals[asset] = w3.codec.decode(['uint8'], res_dec[1])[0]
-        except Exception:
-            decimals[asset] = 18
-
-        asset_data[asset] = {
-            "config": decode_config(conf_uint),
-            "var_rate": var_rate / (D(10) ** 27),
-            "st_rate": st_rate / (D(10) ** 27),
-            "px": D(px_raw) / base_unit_d,
-            "borrow_cap": int(borrow_cap or 0),
-            "supply_cap": int(supply_cap or 0),
-            "aToken": aToken,
-            "sDebt": sDebt,
-            "vDebt": vDebt,
-            "price_feed": price_feed_addr,
-        }
+        aToken, sDebt, vDebt = rd[8], rd[9], rd[10]
 
-        if int(aToken, 16) != 0:
-            aErc = w3.eth.contract(address=aToken, abi=ERC20_ABI)
-            batch2_calls.append((aToken, _encode(aErc.functions.balanceOf(user_address))))
-            batch2_calls.append((aToken, _encode(aErc.functions.totalSupply())))
+        px_raw = abi_decode(_UINT256_TYPES, res_px[1])[0] if res_px[0] else 0
+        if caps is not None:
+            borrow_cap, supply_cap = caps[1], caps[2]
+        elif res_cap[0]:
+            borrow_cap, supply_cap = abi_decode(_CAPS_TYPES, res_cap[1])
+            _CAPS_CACHE[asset] = (now + CAPS_CACHE_TTL_S, int(borrow_cap), int(supply_cap))
         else:
-            batch2_calls.extend([(multicall.address, b''), (multicall.address, b'')])
-
-        if int(sDebt, 16) != 0:
-            sErc = w3.eth.contract(address=sDebt, abi=ERC20_ABI)
-            batch2_calls.append((sDebt, _encode(sErc.functions.balanceOf(user_address))))
-            batch2_calls.append((sDebt, _encode(sErc.functions.totalSupply())))
+            borrow_cap, supply_cap = 0, 0
+        res_src = picked["src"]
+        if res_src[0]:
+            price_feed_addr = abi_decode(_ADDRESS_TYPES, res_src[1])[0]
         else:
-            batch2_calls.extend([(multicall.address, b''), (multicall.address, b'')])
+            # a failed read keeps the cached feed rather than evicting it
+            price_feed_addr = cached.get("price_feed", ZERO_ADDRESS)
 
-        if int(vDebt, 16) != 0:
-            vErc = w3.eth.contract(address=vDebt, abi=ERC20_ABI)
-            batch2_calls.append((vDebt, _encode(vErc.functions.balanceOf(user_address))))
-            batch2_calls.append((vDebt, _encode(vErc.functions.totalSupply())))
+        if meta is not None:
+            symbols[asset], decimals[asset] = meta[0], int(meta[1])
         else:
-            batch2_calls.extend([(multicall.address, b''), (multicall.address, b'')])
+            sym_ok = dec_ok = True
+            try:
+                symbols[asset] = abi_decode(_STRING_TYPES, picked["sym"][1])[0]
+            except Exception:
+                symbols[asset] = "UNKNOWN"
+                sym_ok = False
+            try:
+                decimals[asset] = abi_decode(_UINT8_TYPES, picked["dec"][1])[0]
+            except Exception:
+                decimals[asset] = 18
+                dec_ok = False
+            # only real reads are memoized; fallbacks are retried next time
+            if sym_ok and dec_ok:
+                token_meta[_cache_key(asset)] = [symbols[asset], decimals[asset]]
+                token_meta_dirty = True
+
+        cfg = decode_config(conf_uint)
+        decs = cfg.decimals_bits if cfg.decimals_bits > 0 else int(decimals[asset])
+        i = len(valid_reserves)
+        valid_reserves.append(asset)
+        cfg_list.append(cfg)
+        decs_list.append(decs)
+        var_rate_list.append(var_rate)
+        st_rate_list.append(st_rate)
+        px_list.append(int(px_raw))
+        borrow_cap_list.append(int(borrow_cap or 0))
+        supply_cap_list.append(int(supply_cap or 0))
+
+        fresh = {"aToken": aToken, "sDebt": sDebt, "vDebt": vDebt, "price_feed": price_feed_addr}
+        if cached == fresh:
+            balance_list.append(_pick_slots(results, bslots))
+            continue
+        balance_list.append(None)
 
-        if int(price_feed_addr, 16) != 0:
-            agg = w3.eth.contract(address=price_feed_addr, abi=IChainlinkAggregator_ABI)
-            batch2_calls.append((price_feed_addr, _encode(agg.functions.latestRoundData())))
-        else:
-            batch2_calls.append((multicall.address, b''))
+        # miss, or the reserve's token or feed addresses moved under the cache: re-query in the follow-up batch
+        addr_cache[_cache_key(asset)] = fresh
+        addr_cache_dirty = True
+        batch2_slots.append((i, _append_balance_calls(batch2_calls, balance_user, aToken, sDebt, vDebt,
+                                                      price_feed_addr)))
 
-        call_idx += 6
+    # --- Base currency info (WETH) ---
+    # first reserve per upper-cased symbol; its price and feed timestamp come out of the row loop below
+    sym_to_addr: Dict[str, str] = {}
+    for a, sym in symbols.items():
+        sym_to_addr.setdefault((sym or "").upper(), a)
+    weth_addr = next((sym_to_addr[s] for s in WETH_SYMBOLS if s in sym_to_addr), reserves[0] if reserves else None)
+    eth_price = 0
+    base_last_update = 0
 
-    # -------- Batch 2 --------
-    results_b2 = run_multicall(w3, multicall, batch2_calls)
+    # -------- Batch 2 (cold reserves only) --------
+    results_b2 = await run_multicall_chunked(w3, batch2_calls) if batch2_calls else []
+    for i, slots in batch2_slots:
+        balance_list[i] = _pick_slots(results_b2, slots)
+    if addr_cache_dirty:
+        _save_json_cache(RESERVE_ADDR_CACHE_PATH, addr_cache)
+    if token_meta_dirty:
+        _save_json_cache(TOKEN_META_CACHE_PATH, token_meta)
 
     collateral: List[Dict[str, Any]] = []
     debt: List[Dict[str, Any]] = []
     oracle_assets: List[Dict[str, Any]] = []
     config_caps: List[Dict[str, Any]] = []
 
-    total_collateral_usd_sum = D(0)
-    total_debt_usd_sum = D(0)
-
-    call_idx_b2 = 0
-    for asset in reserves:
-        if asset not in asset_data:
-            call_idx_b2 += 7
-            continue
-
-        ad = asset_data[asset]
-        cfg = ad["config"]
-        decs = int(cfg["decimals_bits"]) if cfg["decimals_bits"] > 0 else int(decimals.get(asset, 18))
-
-        res_a_bal, res_a_supply = results_b2[call_idx_b2: call_idx_b2 + 2]
-        res_s_bal, res_s_supply = results_b2[call_idx_b2 + 2: call_idx_b2 + 4]
-        res_v_bal, res_v_supply = results_b2[call_idx_b2 + 4: call_idx_b2 + 6]
-        res_feed = results_b2[call_idx_b2 + 6]
-
-        a_bal_raw = Web3.to_int(res_a_bal[1]) if res_a_bal[0] and res_a_bal[1] else 0
-        a_sup_raw = Web3.to_int(res_a_supply[1]) if res_a_supply[0] and res_a_supply[1] else 0
-        s_bal_raw = Web3.to_int(res_s_bal[1]) if res_s_bal[0] and res_s_bal[1] else 0
-        s_sup_raw = Web3.to_int(res_s_supply[1]) if res_s_supply[0] and res_s_supply[1] else 0
-        v_bal_raw = Web3.to_int(res_v_bal[1]) if res_v_bal[0] and res_v_bal[1] else 0
-        v_sup_raw = Web3.to_int(res_v_supply[1]) if res_v_supply[0] and res_v_supply[1] else 0
-
+    # USD amounts are summed per fixed-point scale (token decimals + base decimals) and widened once
+    # per distinct scale to the widest one, which keeps the totals exact.
+    usd_scale = base_decimals + max(decs_list, default=0)
+    collateral_usd_by_scale: Dict[int, int] = {}
+    debt_usd_by_scale: Dict[int, int] = {}
+
+    for i, asset in enumerate(valid_reserves):
+        cfg = cfg_list[i]
+        decs = decs_list[i]
+        px_raw = px_list[i]
+        borrow_cap = borrow_cap_list[i]
+        supply_cap = supply_cap_list[i]
+
+        token = {"symbol": symbols.get(asset, "UNKNOWN"), "address": _checksum(asset), "decimals": decs}
+        picked = balance_list[i]
+        a_bal_raw = _uint_result(picked["a_bal"])
+        a_sup_raw = _uint_result(picked["a_sup"])
+        s_bal_raw = _uint_result(picked["s_bal"])
+        s_sup_raw = _uint_result(picked["s_sup"])
+        v_bal_raw = _uint_result(picked["v_bal"])
+        v_sup_raw = _uint_result(picked["v_sup"])
+
+        res_feed = picked["feed"]
         last_update = 0
-        if res_feed[0] and res_feed[1]:
+        if res_feed is not None and res_feed[0] and res_feed[1]:
             try:
-                rd_feed = w3.codec.decode(['uint80', 'int256', 'uint256', 'uint256', 'uint80'], res_feed[1])
+                rd_feed = abi_decode(_FEED_TYPES, res_feed[1])
                 last_update = int(rd_feed[3])
             except Exception:
                 last_update = 0
+        if asset == weth_addr:
+            eth_price, base_last_update = px_raw, last_update
+
+        # token amounts share the reserve's decimals, so ratios can be taken on the raw integers
+        debt_total_raw = s_sup_raw + v_sup_raw
+        utilization = _ratio(debt_total_raw, a_sup_raw) if a_sup_raw > 0 else 0
+        borrow_cap_used_pct = _ratio(debt_total_raw * 100, borrow_cap) if borrow_cap > 0 else 0
+        supply_cap_used_pct = _ratio(a_sup_raw * 100, supply_cap) if supply_cap > 0 else 0
 
-        a_bal = to_units(a_bal_raw, decs)
-        s_bal = to_units(s_bal_raw, decs)
-        v_bal = to_units(v_bal_raw, decs)
-        a_total = to_units(a_sup_raw, decs)
-        s_total = to_units(s_sup_raw, decs)
-        v_total = to_units(v_sup_raw, decs)
-
-        debt_total = s_total + v_total
-        utilization = D(0)
-        if a_total > 0:
-            utilization = debt_total / a_total
-
-        borrow_cap_used_pct = D(0)
-        if ad["borrow_cap"] > 0:
-            denom_tokens = to_units(ad["borrow_cap"], decs)
-            if denom_tokens > 0:
-                borrow_cap_used_pct = (debt_total / denom_tokens) * D(100)
-
-        supply_cap_used_pct = D(0)
-        if ad["supply_cap"] > 0:
-            denom_tokens_s = to_units(ad["supply_cap"], decs)
-            if denom_tokens_s > 0:
-                supply_cap_used_pct = (a_total / denom_tokens_s) * D(100)
-
-        confidence = D("0.99")
+        confidence = "0.99"
         if (symbols.get(asset, "") or "").upper() == "USDC":
-            confidence = D("0.999")
-
-        collateral_row = {
-            "token": {"symbol": symbols.get(asset, "UNKNOWN"), "address": asset, "decimals": decs},
-            "amount": as_str(a_bal),  # string decimal
-            "amount_usd": as_str(a_bal * ad["px"]),  # string decimal
-            "price_usd": as_str(ad["px"]),  # string decimal
-            "usage_as_collateral_enabled": bool(cfg["usage_as_collateral_enabled"]),
-            "reserve_ltv": as_str(D(cfg["ltv_bps"]) / D(10000)),  # string decimal
-            "reserve_liquidation_threshold": as_str(D(cfg["liq_thr_bps"]) / D(10000)),  # string decimal
-            "reserve_liquidation_bonus": as_str(D(cfg["liq_bonus_bps"]) / D(10000)),  # string decimal
-            "emode_category": (str(cfg["emode_category"]) if cfg["emode_category"] is not None else None)
-        }
-        collateral.append(collateral_row)
-
-        user_total_debt_tokens = s_bal + v_bal
-        debt_row = {
-            "token": {"symbol": symbols.get(asset, "UNKNOWN"), "address": asset, "decimals": decs},
-            "variable_debt": as_str(v_bal),  # string decimal
-            "stable_debt": as_str(s_bal),    # string decimal
-            "total_debt_usd": as_str(user_total_debt_tokens * ad["px"]),  # string decimal
-            "variable_borrow_apy": as_str(ad["var_rate"]),  # string decimal
-            "stable_borrow_apy": as_str(ad["st_rate"]),     # string decimal
-            "reserve_utilization": as_str(utilization),      # string decimal
-            "borrow_cap": as_str_uint(ad["borrow_cap"]),     # big counter -> string integer
-            "borrow_cap_used_percent": as_str(borrow_cap_used_pct)  # string decimal
-        }
-        debt.append(debt_row)
+            confidence = "0.999"
+
+        amount_usd_raw = a_bal_raw * px_raw                   # scale: decs + base_decimals
+        user_debt_usd_raw = (s_bal_raw + v_bal_raw) * px_raw  # scale: decs + base_decimals
+        price_usd = fmt_fixed(px_raw, base_decimals)
+
+        if not empty_user:
+            collateral_row = {
+                "token": dict(token),
+                "amount": fmt_fixed(a_bal_raw, decs),  # string decimal
+                "amount_usd": fmt_fixed(amount_usd_raw, decs + base_decimals),  # string decimal
+                "price_usd": price_usd,  # string decimal
+                "usage_as_collateral_enabled": cfg.ltv_bps > 0,
+                "reserve_ltv": fmt_fixed(cfg.ltv_bps, BPS_DECIMALS),  # string decimal
+                "reserve_liquidation_threshold": fmt_fixed(cfg.liq_thr_bps, BPS_DECIMALS),  # string decimal
+                "reserve_liquidation_bonus": fmt_fixed(cfg.liq_bonus_bps, BPS_DECIMALS),  # string decimal
+                "emode_category": str(cfg.emode_category) if cfg.emode_category > 0 else None
+            }
+            collateral.append(collateral_row)
+
+            debt_row = {
+                "token": dict(token),
+                "variable_debt": fmt_fixed(v_bal_raw, decs),  # string decimal
+                "stable_debt": fmt_fixed(s_bal_raw, decs),    # string decimal
+                "total_debt_usd": fmt_fixed(user_debt_usd_raw, decs + base_decimals),  # string decimal
+                "variable_borrow_apy": fmt_fixed(var_rate_list[i], RAY_DECIMALS),  # string decimal
+                "stable_borrow_apy": fmt_fixed(st_rate_list[i], RAY_DECIMALS),     # string decimal
+                "reserve_utilization": fmt_fixed(utilization, RAY_DECIMALS),      # string decimal
+                "borrow_cap": as_str_uint(borrow_cap),     # big counter -> string integer
+                "borrow_cap_used_percent": fmt_fixed(borrow_cap_used_pct, RAY_DECIMALS)  # string decimal
+            }
+            debt.append(debt_row)
 
         oracle_row = {
-            "token": {"symbol": symbols.get(asset, "UNKNOWN"), "address": asset, "decimals": decs},
-            "price_usd": as_str(ad["px"]),  # string decimal
+            "token": dict(token),
+            "price_usd": price_usd,  # string decimal
             "last_update": int(last_update),  # integer timestamp
-            "confidence_score": as_str(confidence)  # string decimal
+            "confidence_score": confidence  # string decimal
         }
         oracle_assets.append(oracle_row)
 
         caps_row = {
-            "token": {"symbol": symbols.get(asset, "UNKNOWN"), "address": asset, "decimals": decs},
-            "supply_cap": as_str_uint(ad["supply_cap"]),                 # big counter -> string integer
-            "supply_cap_used_percent": as_str(supply_cap_used_pct),      # string decimal
-            "borrow_cap": as_str_uint(ad["borrow_cap"]),                 # big counter -> string integer
-            "borrow_cap_used_percent": as_str(borrow_cap_used_pct)       # string decimal
+            "token": dict(token),
+            "supply_cap": as_str_uint(supply_cap),                 # big counter -> string integer
+            "supply_cap_used_percent": fmt_fixed(supply_cap_used_pct, RAY_DECIMALS),  # string decimal
+            "borrow_cap": as_str_uint(borrow_cap),                 # big counter -> string integer
+            "borrow_cap_used_percent": fmt_fixed(borrow_cap_used_pct, RAY_DECIMALS)   # string decimal
         }
         config_caps.append(caps_row)
 
-        total_collateral_usd_sum += a_bal * ad["px"]
-        total_debt_usd_sum += user_total_debt_tokens * ad["px"]
+        row_scale = decs + base_decimals
+        collateral_usd_by_scale[row_scale] = collateral_usd_by_scale.get(row_scale, 0) + amount_usd_raw
+        debt_usd_by_scale[row_scale] = debt_usd_by_scale.get(row_scale, 0) + user_debt_usd_raw
 
-        call_idx_b2 += 7
+    total_collateral_usd_sum = sum(rescale(v, sc, usd_scale) for sc, v in collateral_usd_by_scale.items())
+    total_debt_usd_sum = sum(rescale(v, sc, usd_scale) for sc, v in debt_usd_by_scale.items())
 
     # --- User account data ---
-    u = pool.functions.getUserAccountData(Web3.to_checksum_address(user_address)).call()
-    total_collateral_base = D(u[0])
-    total_debt_base = D(u[1])
-    available_borrows = D(u[2])
-    liq_threshold_bps = D(u[3])
-    ltv_bps_user = D(u[4])
-    health_factor_ray = D(u[5])
-
-    hf = health_factor_ray / (D(10) ** 18) if health_factor_ray > 0 else D(0)
-    ltv_user = ltv_bps_user / D(10000)
-    liq_thr_user = liq_threshold_bps / D(10000)
-
-    total_collateral_usd_api = total_collateral_base / base_unit_d
-    total_debt_usd_api = total_debt_base / base_unit_d
-    available_borrows_usd = available_borrows / base_unit_d
-
-    liq_buffer_usd = (total_collateral_usd_api * liq_thr_user) - total_debt_usd_api
+    total_collateral_base = int(u[0])      # base currency units
+    total_debt_base = int(u[1])            # base currency units
+    available_borrows = int(u[2])          # base currency units
+    liq_threshold_bps = int(u[3])
+    ltv_bps_user = int(u[4])
+    health_factor_wad = int(u[5])
+
+    liq_buffer_usd = total_collateral_base * liq_threshold_bps - total_debt_base * _BPS
     if liq_buffer_usd < 0:
-        liq_buffer_usd = D(0)
+        liq_buffer_usd = 0  # scale: base_decimals + BPS_DECIMALS
 
-    total_collateral_usd = total_collateral_usd_sum if total_collateral_usd_sum > 0 else total_collateral_usd_api
-    total_debt_usd = total_debt_usd_sum if total_debt_usd_sum > 0 else total_debt_usd_api
-    net_equity_usd = D(total_collateral_usd - total_debt_usd)
+    total_collateral_usd = (total_collateral_usd_sum if total_collateral_usd_sum > 0
+                            else rescale(total_collateral_base, base_decimals, usd_scale))
+    total_debt_usd = total_debt_usd_sum if total_debt_usd_sum > 0 else rescale(total_debt_base, base_decimals, usd_scale)
+    net_equity_usd = total_collateral_usd - total_debt_usd
 
-    current_leverage_ratio = D(0)
+    current_leverage_ratio = 0
     if net_equity_usd > 0:
-        current_leverage_ratio = total_collateral_usd / net_equity_usd
+        current_leverage_ratio = _ratio(total_collateral_usd, net_equity_usd)
 
-    max_leverage_at_current_hf = D(0)
-    if total_collateral_usd > 0 and liq_thr_user > 0 and total_debt_usd > 0:
-        debt_ratio = total_debt_usd / total_collateral_usd
-        denom = (liq_thr_user - debt_ratio)
+    # LT / (LT - debt/collateral), cleared of fractions: LT_bps*C / (LT_bps*C - 10^4*D)
+    max_leverage_at_current_hf = 0
+    if total_collateral_usd > 0 and liq_threshold_bps > 0 and total_debt_usd > 0:
+        denom = liq_threshold_bps * total_collateral_usd - _BPS * total_debt_usd
         if denom > 0:
-            max_leverage_at_current_hf = liq_thr_user / denom
-    elif ltv_user > 0:
-        max_leverage_at_current_hf = ltv_user / (D(1) - ltv_user)
+            max_leverage_at_current_hf = _ratio(liq_threshold_bps * total_collateral_usd, denom)
+    elif ltv_bps_user > 0 and ltv_bps_user < _BPS:
+        max_leverage_at_current_hf = _ratio(ltv_bps_user, _BPS - ltv_bps_user)
 
     risk_class = "low"
-    if hf < D("1.05"):
+    if health_factor_wad < HF_HIGH_RISK_WAD:
         risk_class = "high"
-    elif hf < D("1.25"):
+    elif health_factor_wad < HF_MODERATE_RISK_WAD:
         risk_class = "moderate"
-    is_safe = bool(hf > D("1.05"))
-
-    hf_minus_1pct = hf * D("0.99")
-    hf_minus_3pct = hf * D("0.97")
-    hf_minus_5pct = hf * D("0.95")
+    is_safe = bool(health_factor_wad > HF_HIGH_RISK_WAD)
 
-    # --- Base currency info (WETH) ---
-    weth_addr = None
-    for a in reserves:
-        if (symbols.get(a, "") or "").upper() in ("WETH", "WETH.E", "WETH9"):
-            weth_addr = a
-            break
-    if weth_addr is None and reserves:
-        weth_addr = reserves[0]
-
-    eth_price = D(0)
-    base_last_update = 0
-    if weth_addr in asset_data:
-        ad_weth = asset_data[weth_addr]
-        eth_price = ad_weth["px"]
-        if ad_weth["price_feed"] != "0x0000000000000000000000000000000000000000":
-            try:
-                agg = w3.eth.contract(address=ad_weth["price_feed"], abi=IChainlinkAggregator_ABI)
-                rd = agg.functions.latestRoundData().call()
-                base_last_update = int(rd[3])
-            except Exception:
-                base_last_update = 0
+    # stress factors 0.99 / 0.97 / 0.95 applied as integer percents (scale: 18 + 2)
+    hf_minus_1pct = health_factor_wad * 99
+    hf_minus_3pct = health_factor_wad * 97
+    hf_minus_5pct = health_factor_wad * 95
 
     oracles = {
-        "base_currency": {"symbol": "ETH", "price_usd": as_str(eth_price), "last_update": int(base_last_update)},
+        "base_currency": {"symbol": "ETH", "price_usd": fmt_fixed(eth_price, base_decimals), "last_update": int(base_last_update)},
         "assets": oracle_assets
     }
 
@@ -517,29 +723,29 @@ def build_snapshot(rpc_url: str, user_address: str) -> Dict[str, Any]:
 
     snapshot = {
         "network": "base",
-        "chain_id": 8453,  # integer
-        "address": Web3.to_checksum_address(user_address),  # string
+        "chain_id": CHAIN_ID,  # integer
+        "address": user_address,  # string
         "timestamp": int(time.time()),  # integer
         "user": {
-            "health_factor": as_str(hf),
-            "ltv": as_str(ltv_user),
-            "liquidation_threshold": as_str(liq_thr_user),
-            "liquidation_buffer_usd": as_str(liq_buffer_usd),
-            "available_borrows_usd": as_str(available_borrows_usd),
+            "health_factor": fmt_fixed(health_factor_wad, WAD_DECIMALS),
+            "ltv": fmt_fixed(ltv_bps_user, BPS_DECIMALS),
+            "liquidation_threshold": fmt_fixed(liq_threshold_bps, BPS_DECIMALS),
+            "liquidation_buffer_usd": fmt_fixed(liq_buffer_usd, base_decimals + BPS_DECIMALS),
+            "available_borrows_usd": fmt_fixed(available_borrows, base_decimals),
             "risk_class": risk_class,
             "is_safe": is_safe,
             "stress_tests": {
-                "hf_minus_1pct": as_str(hf_minus_1pct),
-                "hf_minus_3pct": as_str(hf_minus_3pct),
-                "hf_minus_5pct": as_str(hf_minus_5pct)
+                "hf_minus_1pct": fmt_fixed(hf_minus_1pct, WAD_DECIMALS + 2),
+                "hf_minus_3pct": fmt_fixed(hf_minus_3pct, WAD_DECIMALS + 2),
+                "hf_minus_5pct": fmt_fixed(hf_minus_5pct, WAD_DECIMALS + 2)
             }
         },
         "totals": {
-            "total_collateral_usd": as_str(total_collateral_usd),
-            "total_debt_usd": as_str(total_debt_usd),
-            "net_equity_usd": as_str(net_equity_usd),
-            "current_leverage_ratio": as_str(current_leverage_ratio),
-            "max_leverage_at_current_hf": as_str(max_leverage_at_current_hf)
+            "total_collateral_usd": fmt_fixed(total_collateral_usd, usd_scale),
+            "total_debt_usd": fmt_fixed(total_debt_usd, usd_scale),
+            "net_equity_usd": fmt_fixed(net_equity_usd, usd_scale),
+            "current_leverage_ratio": fmt_fixed(current_leverage_ratio, RAY_DECIMALS),
+            "max_leverage_at_current_hf": fmt_fixed(max_leverage_at_current_hf, RAY_DECIMALS)
         },
         "collateral": collateral,
         "debt": debt,
@@ -1,124 +1,532 @@
 # validate_schema.py
 from __future__ import annotations
 
+import argparse
+import hashlib
+import heapq
+import importlib.util
 import json
+import mmap
+import os
+import re
 import sys
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple, Union, List
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Union, List
 
 from jsonschema import Draft202012Validator
+from referencing import Registry
+
+try:
+    # Optional: compiles the schema to straight-line Python for a fast happy path
+    import fastjsonschema
+except ImportError:  # pragma: no cover
+    fastjsonschema = None
+
+try:
+    # Optional: parses UTF-8 bytes directly, without materializing a str first
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    # Optional: pysimdjson, the bytes parser used when orjson is not installed
+    import simdjson
+except ImportError:  # pragma: no cover
+    simdjson = None
+
+# Snapshot schema, relative to the repo root
+SCHEMA_PATH = Path("schemas") / "aave-base-hf-snapshot.schema.json"
+
+# Checked-in fastjsonschema module written by scripts/gen_validator.py
+GENERATED_VALIDATOR = Path("schemas") / "_aave_hf_validator.py"
+
+# Data files at least this large are parsed straight from a read-only mmap when the parser
+# accepts buffers (orjson); below it a plain read is cheaper than setting up the mapping.
+MMAP_MIN_BYTES = 64 * 1024
+
+# Values that turn a boolean env flag on
+TRUTHY_ENV_VALUES = ("1", "true", "yes")
+
+# Errors shown per snapshot; the rest are only counted
+MAX_REPORTED_ERRORS = 15
+
+# Top-level sections listed in the success report, with the coarse JSON type the schema
+# requires for each; checked up front so malformed snapshots skip the full validators
+SECTIONS = ("user", "totals", "collateral", "debt", "oracles", "config", "meta")
+SECTION_TYPES: Dict[str, Tuple[type, str]] = {
+    "user": (dict, "object"),
+    "totals": (dict, "object"),
+    "collateral": (list, "array"),
+    "debt": (list, "array"),
+    "oracles": (dict, "object"),
+    "config": (dict, "object"),
+    "meta": (dict, "object"),
+}
 
 Json = Union[Dict[str, Any], List[Any], str, int, float, bool, None]
+# (absolute path as a tuple, ValidationError)
+ErrorEntry = Tuple[Tuple[Union[str, int], ...], Any]
+
+# Both validators walk real dicts/lists, so every backend materializes the full document.
+# orjson scans numbers in C without per-token callbacks, which suits the numeric-heavy snapshot;
+# stdlib json takes the bytes as-is (no parse_* hooks, so its C scanner is used).
+if orjson is not None:
+    _loads: Callable[[bytes], Json] = orjson.loads
+elif simdjson is not None:
+    _loads = simdjson.loads
+else:
+    _loads = json.loads
+
+
+class LoadError(Exception):
+    """A file that could not be read or parsed; the message is ready to report."""
+
+
+def write_err(text: str) -> None:
+    """
+    Write pre-assembled text to stderr in one call, encoded like sys.stderr would.
+    Pending stdout output is flushed first so interleaved reports stay in order.
+    """
+    sys.stdout.flush()
+    stream = sys.stderr
+    stream.flush()
+    stream.buffer.write(text.encode(stream.encoding or "utf-8", "backslashreplace"))
+    stream.buffer.flush()
 
 
 def fail(msg: str, code: int = 1) -> "NoReturn":  # type: ignore[name-defined]
     # Using a tiny shim so Pylance knows we always sys.exit here
-    print(f"ERROR: {msg}")
+    write_err(f"ERROR: {msg}\n")
     sys.exit(code)  # no return
 
 
+def env_flag(name: str) -> bool:
+    """
+    True when the env var is set to one of TRUTHY_ENV_VALUES, case-insensitively;
+    src/handler.py parses its flags the same way.
+    """
+    return os.environ.get(name, "").strip().lower() in TRUTHY_ENV_VALUES
+
+
 def require(cond: bool, msg: str) -> None:
     if not cond:
         fail(msg)
 
 
+def _has_repo_dirs(p: Path) -> bool:
+    # one directory read per level instead of a stat() per folder
+    try:
+        with os.scandir(p) as it:
+            names = {entry.name for entry in it}
+    except OSError:
+        return False
+    return "schemas" in names and "examples" in names
+
+
+@lru_cache(maxsize=None)
 def repo_root_from(start: Path) -> Path:
     """
     Find the repo root containing 'schemas' and 'examples' folders,
     starting at 'start' and walking upward at most 5 levels.
+    AAVE_HF_REPO_ROOT, when set, is used as-is and skips the walk.
     Guaranteed non-None (exits on failure).
     """
+    override = os.environ.get("AAVE_HF_REPO_ROOT")
+    if override:
+        return Path(override)
     p = start
     for _ in range(6):
-        if (p / "schemas").exists() and (p / "examples").exists():
+        if _has_repo_dirs(p):
             return p
         p = p.parent
     fail("Could not find repo root with 'schemas' and 'examples' folders.")
 
 
-def load_json(path: Path, label: str) -> Json:
+def read_file(path: Path, label: str) -> bytes:
     if not path.exists():
-        fail(f"{label} not found: {path}")
+        raise LoadError(f"{label} not found: {path}")
     try:
-        text = path.read_text(encoding="utf-8")
+        return path.read_bytes()
     except Exception as e:
-        fail(f"Failed to read {label} at {path}: {e}")
+        raise LoadError(f"Failed to read {label} at {path}: {e}") from e
+
+
+def parse_json(raw: Union[bytes, memoryview], path: Path, label: str) -> Json:
     try:
-        return json.loads(text)
+        return _loads(raw)
     except Exception as e:
-        fail(f"Failed to parse {label} at {path}: {e}")
-    # unreachable
-    return None  # type: ignore[return-value]
+        raise LoadError(f"Failed to parse {label} at {path}: {e}") from e
+
 
+def load_json(path: Path, label: str) -> Json:
+    if orjson is not None:
+        try:
+            size = path.stat().st_size
+        except OSError:
+            size = 0  # read_file reports it
+        if size >= MMAP_MIN_BYTES:
+            return load_json_mmap(path, label)
+    return parse_json(read_file(path, label), path, label)
 
-def json_pointer(e_path: List[Union[str, int]]) -> str:
+
+def load_json_mmap(path: Path, label: str) -> Json:
+    try:
+        with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            view = memoryview(mm)
+            try:
+                return parse_json(view, path, label)
+            finally:
+                view.release()
+    except (OSError, ValueError) as e:
+        raise LoadError(f"Failed to read {label} at {path}: {e}") from e
+
+
+@lru_cache(maxsize=8)
+def _load_schema_cached(path_str: str, mtime_ns: int) -> Tuple[Json, str]:
+    path = Path(path_str)
+    schema = parse_json(read_file(path, "schema"), path, "schema")
+    return schema, schema_fingerprint(schema)
+
+
+def load_schema(path: Path) -> Tuple[Json, str]:
+    """
+    Parsed schema and its fingerprint, memoized per (path, mtime) for long-lived callers.
+    """
+    if not path.exists():
+        fail(f"schema not found: {path}")
+    try:
+        return _load_schema_cached(str(path), path.stat().st_mtime_ns)
+    except LoadError as e:
+        fail(str(e))
+
+
+# Path segment formatters by exact type: jsonschema paths only hold ints (array indexes)
+# and strs (keys); dots are not escaped since schema keys don’t contain them here
+_SEG_FMT: Dict[type, Callable[[Union[str, int]], str]] = {
+    int: "[{}]".format,
+    str: ".{}".format,
+}
+
+
+def json_pointer(e_path: Iterable[Union[str, int]]) -> str:
     """
     Format a jsonschema error path like $.a[0].b
     """
-    out = "$"
+    parts = ["$"]
+    parts_append = parts.append
+    fmt = _SEG_FMT
     for seg in e_path:
-        if isinstance(seg, int):
-            out += f"[{seg}]"
-        else:
-            # escape dots minimally (schema keys don’t contain quotes here)
-            out += f".{seg}"
-    return out
+        parts_append(fmt[type(seg)](seg))
+    return "".join(parts)
+
+
+def has_external_refs(schema: Json) -> bool:
+    """
+    True if any $ref points outside the document (i.e. not a '#...' fragment).
+    """
+    stack = [schema]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            ref = node.get("$ref")
+            if isinstance(ref, str) and not ref.startswith("#"):
+                return True
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+    return False
+
+
+def build_validator(schema: Dict[str, Any]) -> Draft202012Validator:
+    """
+    Draft 2020-12 validator without format checking; a self-contained schema gets an
+    empty registry instead of the default one that can retrieve remote references.
+    """
+    if has_external_refs(schema):
+        return Draft202012Validator(schema, format_checker=None)
+    return Draft202012Validator(schema, registry=Registry(), format_checker=None)
+
+
+def compile_fast(schema: Dict[str, Any]) -> Optional[Callable[[Json], Any]]:
+    """
+    fastjsonschema validator for the schema, or None when the package is missing
+    or cannot compile it (jsonschema then does all the work).
+    """
+    if fastjsonschema is None:
+        return None
+    try:
+        return fastjsonschema.compile(schema)
+    except Exception:
+        return None
+
+
+def schema_fingerprint(schema: Json) -> str:
+    """
+    blake2b of the schema in canonical JSON form, so line endings (autocrlf checkouts)
+    and formatting do not change it.
+    """
+    canonical = json.dumps(schema, sort_keys=True, separators=(",", ":"))
+    return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def check_schema_once(schema: Dict[str, Any], digest: str, root: Path) -> None:
+    """
+    Metaschema-check the schema unless this exact file content already passed;
+    passing fingerprints are appended to <root>/.cache/checked-schemas.txt.
+    """
+    marker = root / ".cache" / "checked-schemas.txt"
+    try:
+        if digest in marker.read_text(encoding="utf-8").split():
+            return
+    except OSError:
+        pass
+    try:
+        Draft202012Validator.check_schema(schema)
+    except Exception as e:
+        fail(f"Schema is invalid for Draft 2020-12: {e}")
+    try:
+        marker.parent.mkdir(exist_ok=True)
+        with marker.open("a", encoding="utf-8") as f:
+            f.write(digest + "\n")
+    except OSError:
+        pass
+
+
+def generate_validator_code(schema: Dict[str, Any]) -> str:
+    """
+    fastjsonschema.compile_to_code output plus a module-level `validate` alias; the
+    generated entry point is named after the schema's $id.
+    """
+    code = fastjsonschema.compile_to_code(schema)
+    entry = re.search(r"^def (\w+)\(", code, re.MULTILINE)
+    if entry is None:
+        raise ValueError("fastjsonschema output has no validate function")
+    return f"{code}\n\nvalidate = {entry.group(1)}\n"
+
+
+def load_fast_validator(schema: Dict[str, Any], digest: str,
+                        root: Path) -> Optional[Callable[[Json], Any]]:
+    """
+    fastjsonschema validator generated once per schema version and kept in
+    <root>/.cache/validator-<blake2b>.py, so warm runs import it instead of compiling.
+    A cached file that fails to import (e.g. one written without the `validate` alias) is
+    regenerated; an in-memory compile is the fallback when the cache cannot be written or loaded.
+    """
+    if fastjsonschema is None:
+        return None
+    cache_path = root / ".cache" / f"validator-{digest}.py"
+    module_name = f"_validator_{digest}"
+    if cache_path.exists():
+        try:
+            return import_validator(cache_path, module_name).validate
+        except Exception:
+            pass
+    try:
+        code = generate_validator_code(schema)
+        cache_path.parent.mkdir(exist_ok=True)
+        tmp_path = cache_path.with_suffix(".tmp")
+        tmp_path.write_text(code, encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+        return import_validator(cache_path, module_name).validate
+    except Exception:
+        return compile_fast(schema)
+
+
+def import_validator(path: Path, name: str) -> Any:
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)  # type: ignore[arg-type]
+    spec.loader.exec_module(module)  # type: ignore[union-attr]
+    return module
+
+
+def load_generated_validator(digest: str, root: Path) -> Optional[Callable[[Json], Any]]:
+    """
+    The checked-in validator from scripts/gen_validator.py, if present, importable
+    and generated from this exact schema content (matching SCHEMA_FINGERPRINT).
+    """
+    path = root / GENERATED_VALIDATOR
+    if fastjsonschema is None or not path.exists():
+        return None
+    try:
+        module = import_validator(path, "_aave_hf_validator")
+    except Exception:
+        return None
+    if getattr(module, "SCHEMA_FINGERPRINT", None) != digest:
+        return None
+    return module.validate
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Validate AAVE HF snapshots against the repo schema.",
+                                     fromfile_prefix_chars="@")
+    parser.add_argument("data", nargs="*",
+                        help="Snapshot JSON files, or @listfile with one path per line "
+                             "(default: examples/sample-response.json).")
+    parser.add_argument("--legacy", action="store_true",
+                        help="Validate with jsonschema only, skipping the compiled fastjsonschema validators.")
+    parser.add_argument("--no-validate-schema", action="store_true",
+                        help="Skip the Draft 2020-12 metaschema check (also AAVE_HF_SKIP_METASCHEMA=1). "
+                             "Only safe for the schema vendored in this repo.")
+    return parser.parse_args()
+
+
+def collect_errors(validator: Draft202012Validator, data: Json) -> Tuple[List[ErrorEntry], int]:
+    """
+    The first MAX_REPORTED_ERRORS (path tuple, error) pairs in path order, and the total
+    error count. The path tuple is built once and reused for the printed pointer.
+    """
+    # is_valid stops at the first failure; the full error walk only runs to build the report
+    if validator.is_valid(data):
+        return [], 0
+    decorated = [(tuple(e.absolute_path), e) for e in validator.iter_errors(data)]
+    # only the reported errors need ordering: O(n log k) instead of a full sort
+    top = heapq.nsmallest(MAX_REPORTED_ERRORS, decorated, key=itemgetter(0))
+    return top, len(decorated)
+
+
+def precheck_sections(data: Dict[str, Any]) -> List[str]:
+    """
+    Missing or wrongly typed top-level sections, as report lines worded and ordered like
+    the jsonschema report; empty when the coarse shape is right and the full validators should run.
+    """
+    problems: List[Tuple[Tuple[str, ...], str]] = []
+    for section in SECTIONS:
+        if section not in data:
+            problems.append(((), f" - $: '{section}' is a required property"))
+            continue
+        py_type, json_type = SECTION_TYPES[section]
+        value = data[section]
+        if not isinstance(value, py_type):
+            problems.append(((section,), f" - $.{section}: {value!r} is not of type '{json_type}'"))
+    # stable sort: missing sections keep SECTIONS order, which is the schema's `required` order
+    problems.sort(key=itemgetter(0))
+    return [line for _, line in problems]
+
+
+def report_load_error(msg: str, heading: Optional[str] = None) -> None:
+    head = [heading] if heading else []
+    write_err("\n".join(head + [f"ERROR: {msg}"]) + "\n")
+
+
+def report_mismatch(lines: List[str], heading: Optional[str] = None) -> None:
+    # Report goes to stderr as one write
+    head = [heading] if heading else []
+    head.append("❌ Snapshot does NOT match schema.")
+    write_err("\n".join(head + lines) + "\n")
+
+
+def report_errors(errors: List[ErrorEntry], total: int, heading: Optional[str] = None) -> None:
+    lines: List[str] = []
+    _pointer = json_pointer
+    for e_path, e in errors:
+        path = _pointer(e_path)
+        # Some errors carry a 'context' with more details (e.g., anyOf/oneOf);
+        # ValidationError.context is always a list and every entry has a message
+        ctx = ""
+        ctx_list = e.context
+        if ctx_list:
+            ctx_msgs = [c.message for c in ctx_list if c.message]
+            if ctx_msgs:
+                ctx = " | context: " + "; ".join(ctx_msgs)
+        lines.append(f" - {path}: {e.message}{ctx}")
+    if total > len(errors):
+        lines.append(f" ... and {total - len(errors)} more errors")
+    report_mismatch(lines, heading)
+
+
+def report_ok(data: Dict[str, Any], heading: Optional[str] = None) -> None:
+    # Success report goes out as one write
+    report = [heading] if heading else []
+    report.append("✅ OK: snapshot matches schema.")
+    report.append(f"network={data.get('network')}, chain_id={data.get('chain_id')}, address={data.get('address')}")
+    # Optional: quick section sanity
+    report.extend(f" • has {section}: {section in data}" for section in SECTIONS)
+    sys.stdout.write("\n".join(report) + "\n")
 
 
 def main() -> None:
+    args = parse_args()
+
     # Allow running from repo root or a subfolder (like /src)
     cwd = Path.cwd()
     root = repo_root_from(cwd)
 
-    schema_path = root / "schemas" / "aave-hf-snapshot.schema.json"
+    schema_path = root / SCHEMA_PATH
 
-    # Data file may be provided as argv[1]; otherwise default to examples/sample-response.json
-    if len(sys.argv) > 1:
-        data_path = Path(sys.argv[1])
-        if not data_path.is_absolute():
-            data_path = (cwd / data_path).resolve()
-    else:
-        data_path = (root / "examples" / "sample-response.json").resolve()
+    # Data files may be provided as arguments; otherwise default to examples/sample-response.json
+    data_paths = [Path(a) if Path(a).is_absolute() else (cwd / a).resolve() for a in args.data]
+    if not data_paths:
+        data_paths = [(root / "examples" / "sample-response.json").resolve()]
 
-    schema = load_json(schema_path, "schema")
-    data = load_json(data_path, "data")
+    schema, digest = load_schema(schema_path)
 
     # Type enforcement for Pylance: jsonschema expects Mapping[str, Any] (dict) schema
     if not isinstance(schema, dict):
         fail("Schema root must be a JSON object (dict).")
-    # Data can be any JSON value; for our use it should be an object
-    if not isinstance(data, dict):
-        fail("Snapshot root must be a JSON object (dict).")
 
-    # Validate schema first, then the instance
-    try:
-        Draft202012Validator.check_schema(schema)
-    except Exception as e:
-        fail(f"Schema is invalid for Draft 2020-12: {e}")
+    # Validate schema first (unless the caller vouches for it), then the instances
+    skip_metaschema = args.no_validate_schema or env_flag("AAVE_HF_SKIP_METASCHEMA")
+    if not skip_metaschema:
+        check_schema_once(schema, digest, root)
 
-    validator = Draft202012Validator(schema)
-    errors = sorted(validator.iter_errors(data), key=lambda e: list(e.path))
-
-    if errors:
-        print("❌ Snapshot does NOT match schema.")
-        for e in errors[:15]:
-            path = json_pointer(list(e.path))
-            # Some errors carry a 'context' with more details (e.g., anyOf/oneOf)
-            ctx = ""
-            if getattr(e, "context", None):
-                ctx_msgs = "; ".join(c.message for c in e.context if getattr(c, "message", None))
-                if ctx_msgs:
-                    ctx = f" | context: {ctx_msgs}"
-            print(f" - {path}: {e.message}{ctx}")
-        if len(errors) > 15:
-            print(f" ... and {len(errors) - 15} more errors")
-        sys.exit(2)
+    # Validators are set up once and shared by every file. Compiled check first (checked-in
+    # module, else the .cache one); jsonschema only runs when neither is usable or a snapshot
+    # is rejected, since it reports every error.
+    fast_validate = None
+    if not args.legacy:
+        fast_validate = load_generated_validator(digest, root) or load_fast_validator(schema, digest, root)
+    validator: Optional[Draft202012Validator] = None
 
-    print("✅ OK: snapshot matches schema.")
-    print(f"network={data.get('network')}, chain_id={data.get('chain_id')}, address={data.get('address')}")
-    # Optional: quick section sanity
-    for section in ("user", "totals", "collateral", "debt", "oracles", "config", "meta"):
-        print(f" • has {section}: {section in data}")
+    many = len(data_paths) > 1
+    failed = False
+    load_failed = False
+    for data_path in data_paths:
+        heading = f"== {data_path}" if many else None
+        try:
+            data = load_json(data_path, "data")
+        except LoadError as e:
+            report_load_error(str(e), heading)
+            load_failed = True
+            continue
+        # Data can be any JSON value; for our use it should be an object
+        if not isinstance(data, dict):
+            report_load_error(f"Snapshot root must be a JSON object (dict): {data_path}", heading)
+            load_failed = True
+            continue
+
+        problems = precheck_sections(data)
+        if problems:
+            report_mismatch(problems, heading)
+            failed = True
+            continue
+
+        errors: List[ErrorEntry] = []
+        total = 0
+        passed = False
+        if fast_validate is not None:
+            try:
+                fast_validate(data)
+                passed = True
+            except fastjsonschema.JsonSchemaException:
+                pass
+        if not passed:
+            if validator is None:
+                validator = build_validator(schema)
+            errors, total = collect_errors(validator, data)
+
+        if errors:
+            report_errors(errors, total, heading)
+            failed = True
+        else:
+            report_ok(data, heading)
+
+    # 1 when some file could not be checked at all, 2 when every file loaded but some did not match
+    if load_failed:
+        sys.exit(1)
+    if failed:
+        sys.exit(2)
 
 
 # ---- Python <3.11 compatibility for NoReturn shim ----